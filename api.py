@@ -1,91 +1,208 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
+from collections import OrderedDict
+from typing import List, Literal, Optional
+import asyncio
 import json
 import base64
 import os
+import re
+import time
+import uuid
+import metrics
+import profiling
+from serialization import FastJSONResponse, json_response
 from utils import (
     extract_news_articles,
     perform_sentiment_analysis,
+    analyze_sentence_sentiment,
     generate_comparative_analysis,
     get_article_topics,
-    generate_hindi_tts
+    get_overall_outlook,
+    generate_summary,
+    generate_tts,
+    SUMMARY_TEMPLATES,
+    SUPPORTED_LANGUAGES
 )
 
-app = FastAPI(title="News Sentiment Analysis API")
+app = FastAPI(title="News Sentiment Analysis API", default_response_class=FastJSONResponse)
+
+@app.middleware("http")
+async def track_request_metrics(request: Request, call_next):
+    """
+    Record request latency and in-flight count, and expose per-stage timings
+    to the client through the Server-Timing header.
+    """
+    metrics.REQUESTS_IN_FLIGHT.inc()
+    token = metrics.start_request_timings()
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+    finally:
+        elapsed = time.perf_counter() - start
+        timings = metrics.finish_request_timings(token)
+        metrics.REQUESTS_IN_FLIGHT.dec()
+        # Label by route template rather than raw path to keep cardinality bounded
+        route = request.scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        metrics.REQUEST_LATENCY.observe(elapsed, request.method, path, status)
+
+    response.headers["Server-Timing"] = metrics.format_server_timing(timings, total=elapsed)
+    return response
+
+@app.middleware("http")
+async def assign_request_id(request: Request, call_next):
+    """
+    Tag each request with an ID (taken from X-Request-ID if the client sent a
+    sane one) so logs and stored profiles can be correlated with responses.
+    A profiled request also gets X-Profile-ID, the key its profile is stored
+    under, which differs from the request ID if that ID was already profiled.
+    """
+    request_id = request.headers.get("X-Request-ID", "")
+    if not re.fullmatch(r"[A-Za-z0-9._-]{1,64}", request_id):
+        request_id = uuid.uuid4().hex
+    request.state.request_id = request_id
+    response = await call_next(request)
+    response.headers["X-Request-ID"] = request_id
+    profile_id = getattr(request.state, "profile_id", None)
+    if profile_id is not None:
+        response.headers["X-Profile-ID"] = profile_id
+    return response
 
 class CompanyRequest(BaseModel):
     company_name: str
+    num_articles: int = Field(10, ge=1, le=200)
+    languages: List[str] = Field(default_factory=lambda: ["hi"])
+    # Seed for the mock news source, to reproduce a run exactly
+    seed: Optional[int] = None
+    # "sentence" scores long articles sentence by sentence and returns the
+    # score and strongest sentences with each article
+    sentiment_mode: Literal["document", "sentence"] = "document"
+
+# Synthesized audio per (language, text), shared across requests. Values are
+# tasks so concurrent requests for the same summary share one synthesis.
+TTS_CACHE_SIZE = 256
+_tts_cache = OrderedDict()
+
+async def _synthesize(text, lang):
+    audio_bytes = await asyncio.to_thread(generate_tts, text, lang)
+    metrics.TTS_BYTES.inc(len(audio_bytes))
+    return audio_bytes
+
+async def get_tts_audio(text, lang):
+    """
+    Return the speech audio for `text` in `lang`, synthesizing it in a worker
+    thread on a cache miss.
+    """
+    key = (lang, text)
+    task = _tts_cache.get(key)
+    metrics.record_cache("tts", task is not None)
+    if task is None:
+        task = asyncio.ensure_future(_synthesize(text, lang))
+        _tts_cache[key] = task
+        while len(_tts_cache) > TTS_CACHE_SIZE:
+            _tts_cache.popitem(last=False)
+    else:
+        _tts_cache.move_to_end(key)
+    try:
+        # Shield so a cancelled request doesn't cancel synthesis others are waiting on
+        return await asyncio.shield(task)
+    except Exception:
+        if _tts_cache.get(key) is task:
+            del _tts_cache[key]
+        raise
 
 @app.post("/analyze")
-async def analyze_company(request: CompanyRequest):
+async def analyze_company(request: CompanyRequest, http_request: Request):
     """
     Analyze news articles for a specified company.
-    Returns sentiment analysis, comparative analysis, and Hindi TTS audio.
+    Returns sentiment analysis, comparative analysis, and a localized summary
+    with TTS audio for each requested language (Hindi by default).
+    With "sentiment_mode": "sentence" each article also gets a sentiment score
+    and its most strongly worded sentences as highlights.
+    Send "X-Profile: 1" (or ?profile=1) with the X-Admin-Token header to profile
+    the request when profiling is enabled.
     """
+    languages = list(dict.fromkeys(request.languages))
+    unsupported = [lang for lang in languages if lang not in SUPPORTED_LANGUAGES]
+    if not languages or unsupported:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported languages {unsupported}; choose from {list(SUPPORTED_LANGUAGES)}"
+        )
+    
+    profiler = profiling.maybe_start(http_request, http_request.state.request_id)
     try:
         company_name = request.company_name
         
         # Extract news articles
-        articles = extract_news_articles(company_name)
+        with metrics.stage_timer("fetch"):
+            articles = extract_news_articles(company_name, request.num_articles, seed=request.seed)
         
-        # Perform sentiment analysis and topic extraction
-        processed_articles = []
+        # Perform sentiment analysis and topic extraction, annotating articles in place
         sentiments = {"Positive": 0, "Negative": 0, "Neutral": 0}
-        all_topics = []
         
-        for article in articles:
-            # Get sentiment
-            sentiment = perform_sentiment_analysis(article["content"])
-            sentiments[sentiment] += 1
-            
-            # Get topics
-            topics = get_article_topics(article["content"])
-            all_topics.extend(topics)
-            
-            processed_article = {
-                "Title": article["title"],
-                "Summary": article["summary"],
-                "Sentiment": sentiment,
-                "Topics": topics
-            }
-            processed_articles.append(processed_article)
+        # Each stage is timed once per request over all articles, so the stage
+        # histograms hold one sample per request and can be compared directly
+        with metrics.stage_timer("sentiment"):
+            for article in articles:
+                if request.sentiment_mode == "sentence":
+                    result = analyze_sentence_sentiment(article.content)
+                    article.sentiment = result["sentiment"]
+                    article.sentiment_score = result["score"]
+                    article.highlights = result["highlights"]
+                else:
+                    article.sentiment = perform_sentiment_analysis(article.content)
+                sentiments[article.sentiment] += 1
+        
+        with metrics.stage_timer("topics"):
+            for article in articles:
+                article.topics = tuple(get_article_topics(article.content))
+        metrics.ARTICLES_PROCESSED.inc(len(articles))
         
         # Generate comparative analysis
-        comparative_analysis = generate_comparative_analysis(processed_articles)
+        with metrics.stage_timer("comparison"):
+            comparative_analysis = generate_comparative_analysis(articles)
         
         # Determine final sentiment
-        if sentiments["Positive"] > sentiments["Negative"]:
-            final_sentiment = f"{company_name}'s latest news coverage is mostly positive. Potential stock growth expected."
-        elif sentiments["Positive"] < sentiments["Negative"]:
-            final_sentiment = f"{company_name}'s latest news coverage is mostly negative. Caution advised."
-        else:
-            final_sentiment = f"{company_name}'s latest news coverage is mixed. Monitor developments closely."
+        outlook = get_overall_outlook(sentiments)
+        final_sentiment = SUMMARY_TEMPLATES["en"][outlook].format(company=company_name)
         
-        # Generate Hindi TTS
-        hindi_summary = f"{company_name} के बारे में समाचार विश्लेषण। {final_sentiment}"
-        audio_file = generate_hindi_tts(hindi_summary)
-        
-        # Read the audio file and encode as base64
-        with open(audio_file, "rb") as f:
-            audio_base64 = base64.b64encode(f.read()).decode()
+        # Generate localized summaries and synthesize all languages concurrently
+        summaries = {lang: generate_summary(company_name, outlook, lang) for lang in languages}
+        with metrics.stage_timer("tts"):
+            audio = await asyncio.gather(*(get_tts_audio(summaries[lang], lang) for lang in languages))
+        audio_base64 = {lang: base64.b64encode(audio_bytes).decode() for lang, audio_bytes in zip(languages, audio)}
         
         # Prepare the response
         response = {
             "Company": company_name,
-            "Articles": processed_articles,
+            "Articles": [article.to_dict() for article in articles],
             "Comparative Sentiment Score": {
                 "Sentiment Distribution": sentiments,
                 "Coverage Differences": comparative_analysis["Coverage Differences"],
                 "Topic Overlap": comparative_analysis["Topic Overlap"]
             },
             "Final Sentiment Analysis": final_sentiment,
-            "Audio": audio_base64
+            "Summaries": {
+                lang: {"Text": summaries[lang], "Audio": audio_base64[lang]} for lang in languages
+            },
+            # Audio of the first requested language, kept for existing clients
+            "Audio": audio_base64[languages[0]]
         }
         
-        return response
+        with metrics.stage_timer("serialize"):
+            return json_response(http_request, response)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if profiler is not None:
+            profiler.stop()
+            http_request.state.profile_id = profiler.request_id
 
 @app.get("/health")
 async def health_check():
@@ -94,6 +211,37 @@ async def health_check():
     """
     return {"status": "healthy", "service": "News Sentiment Analysis API"}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """
+    Prometheus scrape endpoint with request, pipeline stage and TTS metrics.
+    """
+    return PlainTextResponse(metrics.render_metrics(), media_type=metrics.CONTENT_TYPE)
+
+@app.get("/admin/profiles")
+async def list_profiles(request: Request):
+    """
+    List recently captured request profiles, newest first.
+    """
+    if not profiling.is_admin(request):
+        raise HTTPException(status_code=403, detail="Profile access is not allowed")
+    return {"profiles": profiling.store.list()}
+
+@app.get("/admin/profiles/{request_id}", response_class=PlainTextResponse)
+async def download_profile(request_id: str, request: Request):
+    """
+    Download a profile in collapsed-stack format for flamegraph tools.
+    """
+    if not profiling.is_admin(request):
+        raise HTTPException(status_code=403, detail="Profile access is not allowed")
+    profiler = profiling.store.get(request_id)
+    if profiler is None:
+        raise HTTPException(status_code=404, detail=f"No profile for request {request_id}")
+    return PlainTextResponse(
+        profiler.collapsed(),
+        headers={"Content-Disposition": f'attachment; filename="{request_id}.folded"'}
+    )
+
 @app.get("/companies")
 async def get_sample_companies():
     """
@@ -118,8 +266,11 @@ async def root():
             "/analyze": "POST - Analyze news for a company",
             "/health": "GET - Health check",
             "/companies": "GET - List of sample companies",
+            "/metrics": "GET - Prometheus metrics",
+            "/admin/profiles": "GET - Recent request profiles (when profiling is enabled)",
             "/docs": "OpenAPI documentation"
-        }
+        },
+        "languages": list(SUPPORTED_LANGUAGES)
     }
 
 if __name__ == "__main__":
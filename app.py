@@ -1,10 +1,82 @@
-streamlit run app.py
 # ========== app.py ==========
+# Run with: streamlit run app.py
 import streamlit as st
-import os
-from fetch_news import fetch_news_with_sentiment  # Import function for news extraction
+import threading
+import time
+from fetch_news import iter_news_with_sentiment  # Import function for news extraction
 from sentiment_analysis import comparative_sentiment_analysis  # Import sentiment analysis function
-from tts_hindi import text_to_speech  # Import Text-to-Speech function
+from tts_hindi import text_to_speech_bytes  # Import Text-to-Speech function
+
+# Fetched news is reused for all sessions within the same time bucket
+CACHE_TTL = 15 * 60  # seconds
+
+def time_bucket():
+    return int(time.time() // CACHE_TTL)
+
+class NewsCache:
+    """
+    Results shared by every session, keyed by (company, time bucket).
+    Entries from older buckets are dropped as new ones are stored.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries = {k: v for k, v in self._entries.items() if k[1] >= key[1]}
+            self._entries[key] = value
+
+@st.cache_resource
+def get_news_cache():
+    return NewsCache()
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=256, show_spinner=False)
+def synthesize_summary(summary_text):
+    """
+    Hindi audio for a summary, memoized across sessions. Each session gets its
+    own copy of the bytes, so nothing is shared through a file on disk.
+    """
+    return text_to_speech_bytes(summary_text)
+
+def render_article(article):
+    st.write(f"**{article.title}**")
+    if article.url:
+        st.write(f"🔗 [Read More]({article.url})")
+    st.write(f"📝 Summary: {article.summary}")
+    st.write(f"📊 Sentiment: **{article.sentiment}**")
+    st.write("---")
+
+def load_news(company_name):
+    """
+    Render the company's articles, from the shared cache when possible.
+    On a cache miss each article is shown as soon as it has been fetched.
+    """
+    key = (company_name.strip().lower(), time_bucket())
+    cache = get_news_cache()
+    entry = cache.get(key)
+    if entry is not None:
+        for article in entry["articles"]:
+            render_article(article)
+        return entry
+
+    articles = []
+    with st.spinner("Fetching news..."):
+        for article in iter_news_with_sentiment(company_name):
+            render_article(article)
+            articles.append(article)
+    if not articles:
+        return None
+
+    # Analysis is cached with the articles so reruns don't recompute it
+    entry = {"articles": articles, "analysis": comparative_sentiment_analysis(articles)}
+    cache.put(key, entry)
+    return entry
 
 # Streamlit UI
 st.title("📰 News Summarization & Hindi TTS")
@@ -14,32 +86,24 @@ st.subheader("Analyze news sentiment and listen to Hindi summaries")
 company_name = st.text_input("Enter Company Name", "Tesla")
 
 if st.button("Fetch News"):
-    with st.spinner("Fetching news..."):
-        news_articles = fetch_news_with_sentiment(company_name)  # Fetch news
-    
-    if not news_articles:
+    # Display Articles
+    st.subheader(f"📰 News Articles for {company_name}")
+    entry = load_news(company_name)
+
+    if entry is None:
         st.error("No news articles found!")
     else:
-        # Display Articles
-        st.subheader(f"📰 News Articles for {company_name}")
-        for article in news_articles:
-            st.write(f"**{article['Title']}**")
-            st.write(f"🔗 [Read More]({article['URL']})")
-            st.write(f"📝 Summary: {article['Summary']}")
-            st.write(f"📊 Sentiment: **{article['Sentiment']}**")
-            st.write("---")
-
-        # Perform Comparative Sentiment Analysis
-        with st.spinner("Analyzing sentiment..."):
-            analysis_result = comparative_sentiment_analysis(news_articles)
+        # Comparative Sentiment Analysis
+        analysis_result = entry["analysis"]
 
         st.subheader("📊 Comparative Sentiment Analysis")
         st.json(analysis_result)
 
         # Generate Hindi TTS Summary
         final_summary = f"{company_name} की खबरें ज्यादातर {max(analysis_result['Sentiment Distribution'], key=analysis_result['Sentiment Distribution'].get)} हैं।"
-        audio_file = text_to_speech(final_summary, "summary.mp3")
+        with st.spinner("Generating audio..."):
+            audio_bytes = synthesize_summary(final_summary)
 
         # Play Audio
         st.subheader("🔊 Hindi Audio Summary")
-        st.audio(audio_file, format="audio/mp3")
+        st.audio(audio_bytes, format="audio/mp3")
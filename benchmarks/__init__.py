@@ -0,0 +1,6 @@
+"""
+Offline benchmarks for the news analysis pipeline.
+
+Run with:  python -m benchmarks.run --output bench.json
+Compare:   python -m benchmarks.run --baseline bench.json --threshold 0.2
+"""
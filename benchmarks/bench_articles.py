@@ -0,0 +1,125 @@
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# Allow running as "python benchmarks/bench_articles.py" as well as "python -m benchmarks.bench_articles"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import make_articles
+from models import Article
+
+COMPANY = "Acme"
+TOPICS = ("Earnings", "Revenue", "Innovation")
+
+
+def allocated(build):
+    """
+    Return (result, bytes allocated while building it).
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def bench_memory(fixtures):
+    """
+    Per-article container overhead of the old dict records (scraped dict plus
+    the processed dict copied from it) versus a single slotted Article. Text is
+    shared by both so only the record structure is measured.
+    """
+    def build_dicts():
+        raw_articles, processed_articles = [], []
+        for a in fixtures:
+            raw = {"title": a.title, "content": a.content, "summary": a.summary}
+            processed = {
+                "Title": raw["title"],
+                "Summary": raw["summary"],
+                "Sentiment": a.sentiment.value,
+                "Topics": list(TOPICS)
+            }
+            raw_articles.append(raw)
+            processed_articles.append(processed)
+        return raw_articles, processed_articles
+
+    def build_articles():
+        return [Article(title=a.title, content=a.content, summary=a.summary,
+                        sentiment=a.sentiment, topics=TOPICS) for a in fixtures]
+
+    _, dict_bytes = allocated(build_dicts)
+    _, article_bytes = allocated(build_articles)
+    count = len(fixtures)
+    return {
+        "articles": count,
+        "dict_bytes_per_article": dict_bytes / count,
+        "slotted_bytes_per_article": article_bytes / count,
+        "saving": 1 - article_bytes / dict_bytes
+    }
+
+
+def bench_pipeline(fixtures):
+    """
+    Time the analyze pipeline stages over the whole batch.
+    """
+    import utils
+
+    timings = {}
+    start = time.perf_counter()
+    for article in fixtures:
+        article.sentiment = utils.perform_sentiment_analysis(article.content)
+    timings["sentiment_s"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for article in fixtures:
+        article.topics = tuple(utils.get_article_topics(article.content))
+    timings["topics_s"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    utils.generate_comparative_analysis(fixtures)
+    timings["comparison_s"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    [article.to_dict() for article in fixtures]
+    timings["response_shaping_s"] = time.perf_counter() - start
+
+    timings["total_s"] = sum(timings.values())
+    timings["articles_per_s"] = len(fixtures) / timings["total_s"]
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure per-article memory and pipeline time.")
+    parser.add_argument("--articles", type=int, default=10000)
+    parser.add_argument("--skip-pipeline", action="store_true", help="Only measure memory (no NLP dependencies)")
+    parser.add_argument("--generated", action="store_true",
+                        help="Use utils.generate_news_articles instead of the benchmark fixtures")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for --generated")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    if args.generated:
+        import utils
+        fixtures = list(utils.generate_news_articles(COMPANY, args.articles, seed=args.seed))
+        for article in fixtures:
+            article.sentiment = utils.perform_sentiment_analysis(article.content)
+    else:
+        fixtures = make_articles(COMPANY, args.articles)
+    results = {"memory": bench_memory(fixtures)}
+    if not args.skip_pipeline:
+        results["pipeline"] = bench_pipeline(fixtures)
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
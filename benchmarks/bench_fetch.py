@@ -0,0 +1,131 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+# Allow running as "python benchmarks/bench_fetch.py" as well as "python -m benchmarks.bench_fetch"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import StubServer
+from http_fetch import CircuitOpenError, Fetcher, FetchError
+
+# Short timeouts and cool-down so the scenarios run in a few seconds
+READ_TIMEOUT = 0.5
+COOL_DOWN = 1.0
+
+
+def make_fetcher(**kwargs):
+    options = {"rate": 1000, "burst": 1000, "timeout": (1, READ_TIMEOUT), "max_retries": 2,
+               "failure_threshold": 3, "cool_down": COOL_DOWN}
+    options.update(kwargs)
+    return Fetcher(**options)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    try:
+        result, error = fn(), None
+    except FetchError as e:
+        result, error = None, e
+    return result, error, time.perf_counter() - start
+
+
+def scenario_flaky(base_url):
+    """A host failing twice with 503 is retried until it succeeds."""
+    result, error, elapsed = timed(lambda: make_fetcher().get(f"{base_url}/flaky/retry?fail=2"))
+    return {"ok": error is None and "ok after 3" in result, "elapsed_s": elapsed}
+
+
+def scenario_throttled(base_url):
+    """A host answering 429 opens its circuit; later calls fail without network access."""
+    fetcher = make_fetcher()
+    url = f"{base_url}/status/429?retry_after=0"
+    _, first_error, first = timed(lambda: fetcher.get(url))
+    _, second_error, second = timed(lambda: fetcher.get(url))
+    return {
+        "ok": first_error is not None and isinstance(second_error, CircuitOpenError) and second < 0.01,
+        "first_call_s": first,
+        "open_circuit_call_s": second
+    }
+
+
+def scenario_retry_after(base_url):
+    """A Retry-After longer than the backoff cap keeps the circuit open that long, without retrying."""
+    fetcher = make_fetcher()
+    url = f"{base_url}/status/503?retry_after=60"
+    _, first_error, first = timed(lambda: fetcher.get(url))
+    time.sleep(COOL_DOWN)
+    _, second_error, _ = timed(lambda: fetcher.get(url))
+    return {
+        "ok": first_error is not None and first < 0.5 and isinstance(second_error, CircuitOpenError),
+        "first_call_s": first
+    }
+
+
+def scenario_hang(base_url):
+    """A hanging host costs one read timeout per attempt until its circuit opens."""
+    fetcher = make_fetcher(max_retries=0)
+    url = f"{base_url}/hang?seconds=5"
+    timings = [timed(lambda: fetcher.get(url)) for _ in range(5)]
+    slow = [elapsed for _, _, elapsed in timings[:3]]
+    fast = [elapsed for _, _, elapsed in timings[3:]]
+    return {
+        "ok": all(READ_TIMEOUT * 0.9 < t < READ_TIMEOUT * 3 for t in slow) and all(t < 0.01 for t in fast)
+              and all(isinstance(error, CircuitOpenError) for _, error, _ in timings[3:]),
+        "timed_out_calls_s": slow,
+        "open_circuit_calls_s": fast
+    }
+
+
+def scenario_stale(base_url):
+    """A page fetched earlier is served from cache while its host's circuit is open."""
+    fetcher = make_fetcher(max_retries=0, failure_threshold=1)
+    page_url = f"{base_url}/flaky/stale?fail=0"
+    fresh = fetcher.get(page_url)
+    timed(lambda: fetcher.get(f"{base_url}/status/503"))
+    result, error, elapsed = timed(lambda: fetcher.get(page_url))
+    return {"ok": error is None and result == fresh and fetcher.breaker(page_url).is_open, "elapsed_s": elapsed}
+
+
+def scenario_recovery(base_url):
+    """After the cool-down a single trial call closes the circuit again."""
+    fetcher = make_fetcher(max_retries=0, failure_threshold=1)
+    timed(lambda: fetcher.get(f"{base_url}/status/503"))
+    opened = fetcher.breaker(base_url).is_open
+    time.sleep(COOL_DOWN)
+    _, error, _ = timed(lambda: fetcher.get(f"{base_url}/flaky/recovery?fail=0"))
+    return {"ok": opened and error is None and not fetcher.breaker(base_url).is_open}
+
+
+def scenario_rate_limit(base_url):
+    """A 5 req/s bucket with a burst of 1 spaces out 6 requests over about a second."""
+    fetcher = make_fetcher(rate=5, burst=1)
+    _, _, elapsed = timed(lambda: [fetcher.get(f"{base_url}/flaky/rate?fail=0") for _ in range(6)])
+    return {"ok": 0.9 < elapsed < 2.0, "elapsed_s": elapsed}
+
+
+SCENARIOS = [scenario_flaky, scenario_throttled, scenario_retry_after, scenario_hang, scenario_stale, scenario_recovery, scenario_rate_limit]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exercise the fetch layer against a misbehaving stub server.")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    results = {}
+    with StubServer() as stub:
+        for scenario in SCENARIOS:
+            name = scenario.__name__[len("scenario_"):]
+            results[name] = scenario(stub.base_url)
+            status = "PASS" if results[name]["ok"] else "FAIL"
+            print(f"{status}  {name:<12} {scenario.__doc__}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    return 0 if all(result["ok"] for result in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Allow running as "python benchmarks/bench_replay.py" as well as "python -m benchmarks.bench_replay"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import StubServer
+from benchmarks.run import patched
+import http_fetch
+from page_archive import PageArchive
+
+
+def record(archive_path, companies, articles_per_company):
+    """
+    Scrape every company once against the stub server, recording all pages.
+    """
+    import utils
+
+    with StubServer(num_results=articles_per_company) as stub:
+        recorder = http_fetch.Fetcher(rate=1e6, burst=1e6, mode="record", archive=archive_path)
+        sources = [stub.base_url + "/search?q={company}"]
+        with patched(utils, "NEWS_SOURCES", sources), patched(http_fetch, "fetcher", recorder):
+            for company in companies:
+                utils.scrape_news_articles(company, articles_per_company)
+        recorder.archive.close()
+        return sources
+
+
+def bench_archive(archive_path, rounds):
+    """
+    Raw replay throughput: index build time, then zero-copy and decoded lookups.
+    """
+    start = time.perf_counter()
+    archive = PageArchive(archive_path)
+    open_s = time.perf_counter() - start
+    urls = archive.urls()
+    total_bytes = sum(len(archive.get(url)) for url in urls)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for url in urls:
+            archive.get(url)
+    view_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for url in urls:
+            archive.get_text(url)
+    text_s = time.perf_counter() - start
+    archive.close()
+
+    lookups = rounds * len(urls)
+    return {
+        "pages": len(urls),
+        "archive_bytes": os.path.getsize(archive_path),
+        "open_and_index_ms": open_s * 1000,
+        "memoryview_pages_per_s": lookups / view_s,
+        "text_pages_per_s": lookups / text_s,
+        "text_mb_per_s": rounds * total_bytes / text_s / 1e6
+    }
+
+
+def bench_scrape(archive_path, sources, companies, articles_per_company, nlp):
+    """
+    Scrape every company from the archive with the network unused, optionally
+    running sentiment analysis over the results.
+    """
+    import utils
+
+    replayer = http_fetch.Fetcher(mode="replay", archive=archive_path)
+    results = {}
+    with patched(utils, "NEWS_SOURCES", sources), patched(http_fetch, "fetcher", replayer):
+        start = time.perf_counter()
+        articles = []
+        for company in companies:
+            articles.extend(utils.scrape_news_articles(company, articles_per_company))
+        elapsed = time.perf_counter() - start
+        results["scrape_articles_per_s"] = len(articles) / elapsed
+        results["scraped_articles"] = len(articles)
+
+        if nlp:
+            start = time.perf_counter()
+            for article in articles:
+                utils.perform_sentiment_analysis(article.content)
+            results["sentiment_articles_per_s"] = len(articles) / (time.perf_counter() - start)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record fixture pages once, then benchmark offline replay.")
+    parser.add_argument("--companies", type=int, default=50, help="Companies to record")
+    parser.add_argument("--articles", type=int, default=20, help="Articles per company")
+    parser.add_argument("--rounds", type=int, default=20, help="Passes over the archive for raw lookups")
+    parser.add_argument("--archive", help="Archive path (default: a temporary file)")
+    parser.add_argument("--nlp", action="store_true", help="Also run sentiment analysis on replayed articles")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    archive_path = args.archive or os.path.join(tempfile.mkdtemp(prefix="news-replay-"), "pages.archive")
+    companies = [f"Company{i}" for i in range(args.companies)]
+
+    start = time.perf_counter()
+    sources = record(archive_path, companies, args.articles)
+    results = {"record_s": time.perf_counter() - start}
+    results["archive"] = bench_archive(archive_path, args.rounds)
+    # The stub server is stopped by now, so replay provably needs no network
+    results["replay"] = bench_scrape(archive_path, sources, companies, args.articles, args.nlp)
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+# Allow running as "python benchmarks/bench_sentiment.py" as well as "python -m benchmarks.bench_sentiment"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import make_long_articles
+from models import Sentiment
+import utils
+
+
+def fresh_analyzer_sentiment(text):
+    """
+    Whole-text scoring as it was before the analyzer was shared: a new
+    SentimentIntensityAnalyzer, and so a fresh lexicon load, for every call.
+    """
+    score = utils.SentimentIntensityAnalyzer().polarity_scores(text)["compound"]
+    return utils._label(score)
+
+
+METHODS = {
+    "document_fresh_analyzer": fresh_analyzer_sentiment,
+    "document": lambda text: utils.perform_sentiment_analysis(text, mode="document"),
+    "sentence": lambda text: utils.perform_sentiment_analysis(text, mode="sentence"),
+}
+
+
+def bench_method(fn, articles):
+    """
+    Label every article, returning latency and agreement with the fixture labels.
+    """
+    latencies = []
+    confusion = {expected: {label: 0 for label in Sentiment} for expected in Sentiment}
+    for article in articles:
+        start = time.perf_counter()
+        label = fn(article.content)
+        latencies.append(time.perf_counter() - start)
+        confusion[article.sentiment][label] += 1
+
+    correct = sum(confusion[label][label] for label in Sentiment)
+    return {
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "max_ms": max(latencies) * 1000,
+        "accuracy": correct / len(articles),
+        "recall": {label: confusion[label][label] / max(1, sum(confusion[label].values())) for label in Sentiment},
+        "confusion": confusion
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare whole-text and sentence-level sentiment on long articles.")
+    parser.add_argument("--articles", type=int, default=150, help="Articles per length (a third of each label)")
+    parser.add_argument("--sentences", type=int, nargs="+", default=[20, 80, 320], help="Article lengths in sentences")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    # Load the shared analyzer up front so its one-off cost isn't billed to the first article
+    utils.get_sentiment_analyzer()
+
+    results = {}
+    for sentences in args.sentences:
+        articles = make_long_articles("Acme", args.articles, sentences=sentences, seed=args.seed)
+        words = statistics.fmean(len(article.content.split()) for article in articles)
+        results[sentences] = {"words_per_article": words}
+        for name, fn in METHODS.items():
+            results[sentences][name] = bench_method(fn, articles)
+
+        scored = [utils.analyze_sentence_sentiment(article.content) for article in articles]
+        results[sentences]["sentence_scored_fraction"] = (
+            sum(result["scored"] for result in scored) / sum(result["sentences"] for result in scored)
+        )
+
+        print(f"{sentences} sentences (~{words:.0f} words), {args.articles} articles")
+        for name in METHODS:
+            row = results[sentences][name]
+            print(f"  {name:<24} mean {row['mean_ms']:7.2f} ms  p50 {row['p50_ms']:7.2f} ms  "
+                  f"accuracy {row['accuracy']:.1%}")
+        print(f"  sentence mode scored {results[sentences]['sentence_scored_fraction']:.0%} of sentences")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
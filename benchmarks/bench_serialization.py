@@ -0,0 +1,93 @@
+import argparse
+import base64
+import gzip
+import json
+import os
+import sys
+import time
+
+# Allow running as "python benchmarks/bench_serialization.py" as well as "python -m benchmarks.bench_serialization"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import fake_mp3_bytes, make_articles
+import serialization
+
+COMPANY = "Acme"
+SUMMARY = f"{COMPANY} के बारे में समाचार विश्लेषण। {COMPANY}'s latest news coverage is mixed. Monitor developments closely."
+
+
+def make_response(num_articles):
+    """
+    Build an /analyze response of realistic shape and size without running the NLP stages.
+    """
+    articles = make_articles(COMPANY, num_articles)
+    topics = ("Earnings", "Revenue", "Innovation", "Legal", "Expansion", "Leadership")
+    for i, article in enumerate(articles):
+        article.topics = (topics[i % 6], topics[(i + 2) % 6], topics[(i + 4) % 6])
+    coverage_differences = [{
+        "Comparison": f"Article {i + 1} ({articles[i].title}) has a {articles[i].sentiment} sentiment, while "
+                      f"Article {i + 2} ({articles[i + 1].title}) has a {articles[i + 1].sentiment} sentiment.",
+        "Impact": "This contrast shows different perspectives on the company, potentially affecting investor perception."
+    } for i in range(min(5, num_articles - 1))]
+    return {
+        "Company": COMPANY,
+        "Articles": [article.to_dict() for article in articles],
+        "Comparative Sentiment Score": {
+            "Sentiment Distribution": {"Positive": num_articles // 2, "Negative": num_articles // 3, "Neutral": 0},
+            "Coverage Differences": coverage_differences,
+            "Topic Overlap": {"Common Topics": list(topics)}
+        },
+        "Final Sentiment Analysis": SUMMARY,
+        "Audio": base64.b64encode(fake_mp3_bytes(SUMMARY)).decode()
+    }
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def bench(num_articles, repeat):
+    content = make_response(num_articles)
+    results = {}
+
+    try:
+        from fastapi.encoders import jsonable_encoder
+    except ImportError:
+        jsonable_encoder = None
+    if jsonable_encoder is not None:
+        results["jsonable_encoder+json_ms"], _ = timed(
+            lambda: json.dumps(jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")).encode(), repeat)
+    results["stdlib_json_ms"], _ = timed(
+        lambda: json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode(), repeat)
+    results["serialization.dumps_ms"], body = timed(lambda: serialization.dumps(content), repeat)
+
+    results["identity_bytes"] = len(body)
+    results["gzip_ms"], compressed = timed(lambda: gzip.compress(body, compresslevel=serialization.GZIP_LEVEL), repeat)
+    results["gzip_bytes"] = len(compressed)
+    if serialization.brotli is not None:
+        results["br_ms"], compressed = timed(lambda: serialization.compress(body, "br"), repeat)
+        results["br_bytes"] = len(compressed)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure /analyze response serialization time and size.")
+    parser.add_argument("--counts", default="10,200", help="Comma-separated article counts")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    results = {f"n={n}": bench(int(n), args.repeat) for n in args.counts.split(",")}
+    results["orjson"] = serialization.orjson is not None
+    results["brotli"] = serialization.brotli is not None
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
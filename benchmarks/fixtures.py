@@ -0,0 +1,240 @@
+import html
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlparse
+
+from models import Article, Sentiment
+
+# Paragraphs used to build fixture articles, tagged with the sentiment they carry
+FIXTURE_PARAGRAPHS = [
+    ("Positive", "{company} reported quarterly revenue well ahead of analyst expectations, driven by strong demand in its core markets and improving margins. Management raised full-year guidance and said the order backlog is at a record high."),
+    ("Positive", "Shares of {company} rallied after the company unveiled a new product line that early reviewers praised for its performance and price. Analysts upgraded the stock, citing a clear path to market share gains."),
+    ("Positive", "{company} announced a strategic partnership with a leading cloud provider to accelerate research and development. Both companies expect the alliance to create new revenue streams and speed up innovation."),
+    ("Negative", "Regulators opened an investigation into {company} over alleged anti-competitive practices, and the stock fell sharply on the news. Legal experts warned that penalties could be significant if the allegations are upheld."),
+    ("Negative", "{company} announced layoffs affecting several thousand employees as part of a restructuring plan. The company blamed weak demand, rising costs and supply chain disruptions for the disappointing results."),
+    ("Negative", "A lawsuit filed by competitors accuses {company} of patent infringement and seeks damages that could hurt profits. Investors reacted nervously, and several funds reduced their positions."),
+    ("Neutral", "The chief executive of {company} spoke at an industry conference on Tuesday, outlining the company's long-term roadmap. The presentation covered manufacturing, logistics and the schedule for upcoming product updates."),
+    ("Neutral", "{company} will hold its annual shareholder meeting next month, where investors will vote on board nominations. The agenda also includes a review of the company's sustainability reporting."),
+]
+
+TOPIC_WORDS = ["earnings", "revenue", "innovation", "technology", "regulations",
+               "lawsuit", "expansion", "restructuring", "leadership", "sustainability"]
+
+
+def make_articles(company_name, num_articles, paragraphs=3):
+    """
+    Build a deterministic list of fixture articles like those returned by
+    extract_news_articles. Each article is several paragraphs long so the
+    NLP stages see realistic input sizes. `sentiment` holds the label the
+    first paragraph was written to convey.
+    """
+    articles = []
+    for i in range(num_articles):
+        chosen = [FIXTURE_PARAGRAPHS[(i + k * 3) % len(FIXTURE_PARAGRAPHS)] for k in range(paragraphs)]
+        content = " ".join(text.format(company=company_name) for _, text in chosen)
+        title = f"{company_name} news update #{i + 1}: {TOPIC_WORDS[i % len(TOPIC_WORDS)]}"
+        articles.append(Article(
+            title=title,
+            content=content,
+            summary=content[:150] + "..." if len(content) > 150 else content,
+            sentiment=Sentiment(chosen[0][0])
+        ))
+    return articles
+
+
+# Page furniture that scraped articles carry around the story itself
+BOILERPLATE_PARAGRAPHS = [
+    "Reporting by staff writers. Editing by the business desk.",
+    "Sign up for our newsletter to get the day's business news in your inbox. You can unsubscribe at any time.",
+    "Related coverage: {company} investor day schedule. {company} quarterly filing calendar.",
+    "Figures are in U.S. dollars unless stated otherwise. Market data is delayed by at least 15 minutes.",
+]
+
+# Topics for long articles. Unlike labels such as "Growth" or "Lawsuit" these
+# carry no sentiment of their own, so neutral sentences really are neutral
+LONG_ARTICLE_TOPICS = ["earnings", "revenue", "technology", "research", "international markets",
+                       "product development", "hiring", "manufacturing", "pricing", "cloud services"]
+
+# Share of each sentence kind in a long article, by the article's label
+LONG_ARTICLE_MIX = {
+    "Positive": {"Positive": 0.3, "Negative": 0.1, "Neutral": 0.6},
+    "Negative": {"Positive": 0.1, "Negative": 0.3, "Neutral": 0.6},
+    "Neutral": {"Positive": 0.05, "Negative": 0.05, "Neutral": 0.9},
+}
+
+
+def make_long_articles(company_name, num_articles, sentences=80, seed=0):
+    """
+    Build long fixture articles like those returned by scrape_news_articles:
+    a story whose tone is set by `sentiment` (cycling Positive, Negative,
+    Neutral), with a minority of contrary sentences, mostly neutral ones, and
+    page boilerplate at the end. `sentiment` is the label a reader would give.
+    """
+    from utils import MOCK_SENTENCES
+
+    rng = random.Random(seed)
+    pools = {label: list(pool) for label, pool in MOCK_SENTENCES.items()}
+    for label, paragraph in FIXTURE_PARAGRAPHS:
+        pools[label].extend(part + "." for part in paragraph.rstrip(".").split(". "))
+
+    articles = []
+    labels = list(LONG_ARTICLE_MIX)
+    for i in range(num_articles):
+        label = labels[i % len(labels)]
+        mix = LONG_ARTICLE_MIX[label]
+        kinds = rng.choices(list(mix), weights=list(mix.values()), k=sentences)
+        # The lede carries the story's tone
+        kinds[0] = label
+        parts = [rng.choice(pools[kind]).format(company=company_name, topic=rng.choice(LONG_ARTICLE_TOPICS))
+                 for kind in kinds]
+        parts.extend(paragraph.format(company=company_name) for paragraph in BOILERPLATE_PARAGRAPHS)
+        content = " ".join(parts)
+        articles.append(Article(
+            title=f"{company_name} long read #{i + 1}",
+            content=content,
+            summary=content[:150] + "...",
+            sentiment=Sentiment(label)
+        ))
+    return articles
+
+
+def fake_mp3_bytes(text):
+    """
+    Deterministic stand-in for gTTS output, sized roughly like real MP3 speech
+    (gTTS produces roughly 400 bytes of audio per character of Hindi text).
+    Random bytes, since compressed audio does not compress any further.
+    """
+    size = 400 * max(len(text), 1)
+    return b"ID3" + random.Random(size).randbytes(size - 3)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """
+    Serves search result pages, article pages and TTS audio for benchmarks,
+    plus misbehaving endpoints for exercising the fetch layer:
+      /status/<code>?retry_after=N  always answers with <code>
+      /hang?seconds=N               stalls before answering
+      /flaky/<key>?fail=N           answers 503 to the first N requests per key
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        if server.latency:
+            time.sleep(server.latency)
+
+        if parsed.path == "/search":
+            company = query.get("q", ["Company"])[0]
+            items = []
+            for i in range(server.num_results):
+                items.append(
+                    f'<article><h2>{html.escape(company)} story {i + 1}</h2>'
+                    f'<a href="{server.base_url}/article/{i}?q={quote(company)}">Read more</a></article>'
+                )
+            body = f"<html><body>{''.join(items)}</body></html>"
+            self._send(200, body.encode())
+        elif parsed.path.startswith("/article/"):
+            company = query.get("q", ["Company"])[0]
+            index = int(parsed.path.rsplit("/", 1)[-1])
+            article = make_articles(company, index + 1)[index]
+            paragraphs = "".join(f"<p>{html.escape(p)}.</p>" for p in article.content.split(". "))
+            body = (
+                f"<html><head><title>{html.escape(article.title)}</title></head><body>"
+                f"<h1>{html.escape(article.title)}</h1>"
+                f'<div class="article-body">{paragraphs}</div></body></html>'
+            )
+            self._send(200, body.encode())
+        elif parsed.path == "/tts":
+            self._send(200, fake_mp3_bytes(query.get("text", [""])[0]), "audio/mpeg")
+        elif parsed.path.startswith("/status/"):
+            status = int(parsed.path.rsplit("/", 1)[-1])
+            self.send_response(status)
+            self.send_header("Retry-After", query.get("retry_after", ["0"])[0])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif parsed.path == "/hang":
+            time.sleep(float(query.get("seconds", ["30"])[0]))
+            self._send(200, b"<html><body>late</body></html>")
+        elif parsed.path.startswith("/flaky/"):
+            with server.lock:
+                hits = server.hits[parsed.path] = server.hits.get(parsed.path, 0) + 1
+            if hits <= int(query.get("fail", ["1"])[0]):
+                self._send(503, b"unavailable")
+            else:
+                self._send(200, f"<html><body>ok after {hits} requests</body></html>".encode())
+        else:
+            self._send(404, b"not found")
+
+
+class StubServer:
+    """
+    Local HTTP server standing in for news sites and the TTS service.
+    Usable as a context manager; base_url is set once it is running.
+    """
+
+    def __init__(self, latency=0.0, num_results=20):
+        self.latency = latency
+        self.num_results = num_results
+        self.base_url = None
+        self._httpd = None
+        self._thread = None
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self._httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_port}"
+        self._httpd.base_url = self.base_url
+        self._httpd.latency = self.latency
+        self._httpd.num_results = self.num_results
+        self._httpd.hits = {}
+        self._httpd.lock = threading.Lock()
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def make_stub_tts(base_url):
+    """
+    Return a gTTS-compatible class that fetches audio from the stub server,
+    so TTS benchmarks include a realistic HTTP round trip without the network.
+    """
+    import requests
+
+    class StubTTS:
+        def __init__(self, text, lang="hi", slow=False, **kwargs):
+            self.text = text
+            self.lang = lang
+
+        def write_to_fp(self, fp):
+            response = requests.get(f"{base_url}/tts", params={"text": self.text, "lang": self.lang}, timeout=10)
+            response.raise_for_status()
+            fp.write(response.content)
+
+        def save(self, savefile):
+            with open(savefile, "wb") as f:
+                self.write_to_fp(f)
+
+    return StubTTS
@@ -0,0 +1,252 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Allow running as "python benchmarks/run.py" as well as "python -m benchmarks.run"
+sys.path.insert(0, REPO_DIR)
+
+from benchmarks.fixtures import StubServer, make_articles, make_stub_tts
+
+COMPANY = "Acme"
+
+
+@contextmanager
+def patched(obj, attr, value):
+    """
+    Temporarily replace an attribute (e.g. a news source URL list or gTTS).
+    """
+    original = getattr(obj, attr)
+    setattr(obj, attr, value)
+    try:
+        yield
+    finally:
+        setattr(obj, attr, original)
+
+
+def measure(fn, repeat, concurrency, items=1, warmup=1):
+    """
+    Call fn() `repeat` times across `concurrency` threads and summarize latency.
+    `items` is the number of articles each call handles, for throughput, or
+    None to count the articles each call actually returns (len(fn())).
+    """
+    for _ in range(warmup):
+        fn()
+
+    def timed_call(_):
+        start = time.perf_counter()
+        result = fn()
+        return time.perf_counter() - start, items if items is not None else len(result)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        calls = list(pool.map(timed_call, range(repeat)))
+    wall = time.perf_counter() - start
+    latencies = sorted(latency for latency, _ in calls)
+    handled = sum(count for _, count in calls)
+
+    return {
+        "calls": repeat,
+        "concurrency": concurrency,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000,
+        "max_ms": latencies[-1] * 1000,
+        "calls_per_s": repeat / wall,
+        "articles_per_call": handled / repeat,
+        "articles_per_s": handled / wall
+    }
+
+
+def annotate_topics(articles):
+    """
+    Fill in topics the way api.analyze_company does, ready for comparison.
+    """
+    import utils
+
+    for article in articles:
+        article.topics = tuple(utils.get_article_topics(article.content))
+    return articles
+
+
+def bench_stages(counts, concurrencies, repeat, base_url):
+    import http_fetch
+    import utils
+
+    # Measure scraping itself rather than the production per-host rate limit
+    unthrottled = http_fetch.Fetcher(rate=1e6, burst=1e6)
+
+    results = {}
+    scrape_sources = [base_url + "/search?q={company}"]
+    for count in counts:
+        articles = make_articles(COMPANY, count)
+        annotated_articles = annotate_topics(make_articles(COMPANY, count))
+        # (fn, articles per call); None counts what fn returns, so articles
+        # made up to fill a short result aren't credited as fetched
+        stages = {
+            "extract_news_articles": (lambda: utils.extract_news_articles(COMPANY, count), None),
+            "scrape_news_articles": (lambda: [a for a in utils.scrape_news_articles(COMPANY, count) if a.url], None),
+            "perform_sentiment_analysis": (lambda: [utils.perform_sentiment_analysis(a.content) for a in articles], count),
+            "get_article_topics": (lambda: [utils.get_article_topics(a.content) for a in articles], count),
+            "generate_comparative_analysis": (lambda: utils.generate_comparative_analysis(annotated_articles), count),
+        }
+        with patched(utils, "NEWS_SOURCES", scrape_sources), patched(http_fetch, "fetcher", unthrottled):
+            for name, (fn, items) in stages.items():
+                for concurrency in concurrencies:
+                    key = f"{name}/n={count}/c={concurrency}"
+                    results[key] = measure(fn, repeat, concurrency, items=items)
+                    print_result(key, results[key])
+
+    summary = utils.generate_summary(COMPANY, "mixed", "hi")
+    with patched(utils, "gTTS", make_stub_tts(base_url)):
+        for concurrency in concurrencies:
+            key = f"generate_tts/c={concurrency}"
+            results[key] = measure(lambda: utils.generate_tts(summary, "hi"), repeat, concurrency)
+            print_result(key, results[key])
+    return results
+
+
+@contextmanager
+def api_server(base_url):
+    """
+    Run the FastAPI app under uvicorn on a free local port with TTS stubbed.
+    """
+    import socket
+
+    import uvicorn
+
+    import api
+    import utils
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    config = uvicorn.Config(api.app, host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    with patched(utils, "gTTS", make_stub_tts(base_url)):
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
+        while not server.started:
+            time.sleep(0.05)
+        try:
+            yield f"http://127.0.0.1:{port}"
+        finally:
+            server.should_exit = True
+            thread.join()
+
+
+def bench_api(counts, concurrencies, repeat, base_url):
+    import requests
+
+    results = {}
+    with api_server(base_url) as api_url:
+        session = requests.Session()
+        for count in counts:
+            def call():
+                response = session.post(f"{api_url}/analyze", json={"company_name": COMPANY, "num_articles": count})
+                response.raise_for_status()
+                return response.json()["Articles"]
+            for concurrency in concurrencies:
+                key = f"api_analyze/n={count}/c={concurrency}"
+                results[key] = measure(call, repeat, concurrency, items=None)
+                print_result(key, results[key])
+    return results
+
+
+def print_result(key, result):
+    print(f"{key:<50} p50 {result['p50_ms']:9.2f} ms  p95 {result['p95_ms']:9.2f} ms  "
+          f"{result['articles_per_s']:10.1f} articles/s")
+
+
+def git_commit():
+    try:
+        # Run in the repo so the commit is recorded wherever the suite is started from
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=REPO_DIR).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold, metric="p50_ms"):
+    """
+    Compare results against a baseline run. Returns the list of benchmarks
+    whose `metric` got slower by more than `threshold` (a fraction).
+    """
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get("results", {}).get(key)
+        if previous is None:
+            continue
+        change = (result[metric] - previous[metric]) / previous[metric] if previous[metric] else 0.0
+        marker = "REGRESSION" if change > threshold else ""
+        print(f"{key:<50} {previous[metric]:9.2f} -> {result[metric]:9.2f} ms  {change:+7.1%}  {marker}")
+        if change > threshold:
+            regressions.append(key)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the news analysis pipeline offline.")
+    parser.add_argument("--counts", default="1,10,50", help="Comma-separated article counts")
+    parser.add_argument("--concurrency", default="1,4", help="Comma-separated thread counts")
+    parser.add_argument("--repeat", type=int, default=20, help="Calls per benchmark")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated stub server latency in seconds")
+    parser.add_argument("--skip-api", action="store_true", help="Skip the full /analyze benchmark")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", help="Compare against a previous JSON results file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p50 slowdown before failing")
+    args = parser.parse_args(argv)
+
+    counts = [int(c) for c in args.counts.split(",")]
+    concurrencies = [int(c) for c in args.concurrency.split(",")]
+
+    # The pipeline writes audio files to the working directory, keep them out of the repo
+    workdir = tempfile.mkdtemp(prefix="news-bench-")
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        # Enough search results that the largest count is scraped in full
+        with StubServer(latency=args.latency, num_results=max(counts)) as stub:
+            results = bench_stages(counts, concurrencies, args.repeat, stub.base_url)
+            if not args.skip_api:
+                results.update(bench_api(counts, concurrencies, args.repeat, stub.base_url))
+    finally:
+        os.chdir(cwd)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": vars(args)
+        },
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
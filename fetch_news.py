@@ -1,40 +1,74 @@
-import requests
 from bs4 import BeautifulSoup
-from newspaper import Article
+from newspaper import Article as NewspaperArticle
+from models import Article
+from http_fetch import FetchError, fetch
+from sentiment_analysis import get_sentiment
 
-def fetch_news(company_name):
+# Bing News search page, formatted with the company name
+SEARCH_URL = "https://www.bing.com/news/search?q={company}&FORM=HDRSC6"
+
+def iter_news(company_name, limit=10):
     """
     Fetches news articles related to a company from Bing News and extracts the article content.
+    Yields each article as soon as it has been downloaded and parsed. If Bing News
+    cannot be reached (or is being skipped after repeated failures), mock articles
+    are yielded instead.
     """
-    search_url = f"https://www.bing.com/news/search?q={company_name}&FORM=HDRSC6"
+    search_url = SEARCH_URL.format(company=company_name)
     headers = {"User-Agent": "Mozilla/5.0"}
 
-    response = requests.get(search_url, headers=headers)
-    if response.status_code != 200:
-        return f"Failed to retrieve news. Status Code: {response.status_code}"
+    try:
+        page = fetch(search_url, headers)
+    except FetchError as e:
+        print(f"Failed to retrieve news: {str(e)}")
+        # Imported here since utils pulls in the heavier NLP dependencies
+        from utils import extract_news_articles
+        yield from extract_news_articles(company_name, limit)
+        return
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(page, "html.parser")
     
     # Extract news article links
     news_links = [a['href'] for a in soup.select("a[href]") if "http" in a['href']]
     
-    articles = []
-    
-    for link in news_links[:10]:  # Limit to first 10 articles
+    for link in news_links[:limit]:  # Limit to first 10 articles by default
         try:
-            article = Article(link)
-            article.download()
+            article = NewspaperArticle(link)
+            article.download(input_html=fetch(link, headers))
             article.parse()
-            
-            articles.append({
-                "Title": article.title,
-                "URL": link,
-                "Summary": article.text[:500] + "..." if len(article.text) > 500 else article.text
-            })
-        except:
+        except FetchError as e:
+            print(f"Error fetching article content: {str(e)}")
+            continue
+        except Exception as e:
+            print(f"Error parsing article {link}: {str(e)}")
             continue
 
-    return articles
+        yield Article(
+            title=article.title,
+            content=article.text,
+            summary=article.text[:500] + "..." if len(article.text) > 500 else article.text,
+            url=link
+        )
+
+def fetch_news(company_name):
+    """
+    Fetches news articles related to a company from Bing News and extracts the article content.
+    """
+    return list(iter_news(company_name))
+
+def iter_news_with_sentiment(company_name, limit=10):
+    """
+    Like iter_news, but attaches a sentiment label to each article before yielding it.
+    """
+    for article in iter_news(company_name, limit):
+        article.sentiment = get_sentiment(article.content or article.summary)
+        yield article
+
+def fetch_news_with_sentiment(company_name, limit=10):
+    """
+    Fetches news articles for a company with a sentiment label on each one.
+    """
+    return list(iter_news_with_sentiment(company_name, limit))
 
 # Example Usage:
 if __name__ == "__main__":
@@ -0,0 +1,322 @@
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+import requests
+
+import metrics
+from page_archive import ArchiveError, PageArchive
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Per-host token bucket: sustained requests per second and burst size
+RATE_PER_SECOND = float(os.environ.get("FETCH_RATE_PER_SECOND", "2"))
+BURST = int(os.environ.get("FETCH_BURST", "5"))
+# Longest we will wait for a token before giving up on a request
+MAX_RATE_WAIT = float(os.environ.get("FETCH_MAX_RATE_WAIT", "2"))
+
+# (connect, read) timeouts in seconds; a hanging server costs at most the read timeout
+TIMEOUT = (float(os.environ.get("FETCH_CONNECT_TIMEOUT", "3")), float(os.environ.get("FETCH_READ_TIMEOUT", "5")))
+
+# Retries for transient failures, with full-jitter exponential backoff
+MAX_RETRIES = int(os.environ.get("FETCH_MAX_RETRIES", "2"))
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 4.0
+TRANSIENT_STATUS = {429, 500, 502, 503, 504}
+
+# Consecutive failures that open a host's circuit, and how long it stays open
+FAILURE_THRESHOLD = int(os.environ.get("FETCH_FAILURE_THRESHOLD", "3"))
+COOL_DOWN = float(os.environ.get("FETCH_COOL_DOWN", "60"))
+
+# Last good body per URL, served when a host is failing
+STALE_CACHE_SIZE = 512
+
+# "live" fetches from the network; "record" also appends every fetched page to
+# FETCH_ARCHIVE; "replay" serves pages from FETCH_ARCHIVE with no network access
+FETCH_MODE = os.environ.get("FETCH_MODE", "live")
+FETCH_ARCHIVE = os.environ.get("FETCH_ARCHIVE", "pages.archive")
+FETCH_MODES = ("live", "record", "replay")
+
+FETCH_REQUESTS = metrics.REGISTRY.register(metrics.Counter(
+    "fetch_requests_total",
+    "Outbound fetch attempts by outcome (ok, error, retry, throttled, circuit_open, stale, replay).",
+    ["outcome"]
+))
+
+
+class FetchError(Exception):
+    """
+    A URL could not be fetched.
+    """
+
+
+class CircuitOpenError(FetchError):
+    """
+    The URL's host is failing and is being skipped until its cool-down ends.
+    """
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how often a host is hit.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, max_wait=MAX_RATE_WAIT):
+        """
+        Take a token, sleeping until one is available. Returns False without
+        taking a token if that would mean waiting longer than max_wait.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = (1 - self._tokens) / self.rate if self._tokens < 1 else 0.0
+            if wait > max_wait:
+                return False
+            # Reserve the token now so concurrent callers queue up behind us
+            self._tokens -= 1
+        if wait:
+            time.sleep(wait)
+        return True
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls for
+    `cool_down` seconds. After that a single trial call is let through: success
+    closes the circuit, failure opens it for another cool-down. hold_off()
+    opens it straight away for longer, when a host asks us to back off.
+    """
+
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, cool_down=COOL_DOWN):
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+        self._failures = 0
+        self._opened_at = None
+        self._retry_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        with self._lock:
+            return self._opened_at is not None
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() < self._retry_at or self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def cancel_trial(self):
+        """
+        Give up a trial call that was allowed but never made.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._retry_at = max(self._retry_at, self._opened_at + self.cool_down)
+            self._trial_in_flight = False
+
+    def hold_off(self, seconds):
+        """
+        Open the circuit for at least `seconds` (and at least the cool-down).
+        """
+        with self._lock:
+            self._failures += 1
+            self._opened_at = time.monotonic()
+            self._retry_at = max(self._retry_at, self._opened_at + max(self.cool_down, seconds))
+            self._trial_in_flight = False
+
+
+class Fetcher:
+    """
+    HTTP GET with per-host rate limiting, jittered retries on transient errors,
+    per-host circuit breakers and a stale-on-error cache of recent pages.
+    In "record" mode fetched pages are also appended to `archive`; in "replay"
+    mode pages are served only from `archive` (a PageArchive or its path).
+    """
+
+    def __init__(self, rate=RATE_PER_SECOND, burst=BURST, timeout=TIMEOUT, max_retries=MAX_RETRIES,
+                 failure_threshold=FAILURE_THRESHOLD, cool_down=COOL_DOWN, mode="live", archive=None):
+        if mode not in FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode {mode!r}; expected one of {FETCH_MODES}")
+        if mode != "live" and archive is None:
+            raise ValueError(f"Fetch mode {mode!r} needs an archive")
+        self.rate = rate
+        self.burst = burst
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+        self.mode = mode
+        self.archive = archive
+        self._archive_lock = threading.Lock()
+        self.session = requests.Session()
+        self._hosts = {}
+        self._stale = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _host_state(self, url):
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = (
+                    TokenBucket(self.rate, self.burst),
+                    CircuitBreaker(self.failure_threshold, self.cool_down)
+                )
+            return state
+
+    def breaker(self, url):
+        return self._host_state(url)[1]
+
+    def _get_archive(self):
+        # Opened on first use so importing this module never touches the disk.
+        # A missing or corrupt archive is a FetchError, so callers fall back
+        # to mock articles as they would for any other unreachable source.
+        if isinstance(self.archive, PageArchive):
+            return self.archive
+        with self._archive_lock:
+            if not isinstance(self.archive, PageArchive):
+                try:
+                    self.archive = PageArchive(self.archive, writable=self.mode == "record")
+                except (OSError, ArchiveError) as e:
+                    raise FetchError(f"Cannot open page archive {self.archive}: {e}") from e
+        return self.archive
+
+    def _remember(self, url, text):
+        if self.mode == "record":
+            try:
+                self._get_archive().append(url, text)
+            except (OSError, FetchError) as e:
+                # The page itself was fetched fine; only the recording is lost
+                print(f"Error recording {url}: {str(e)}")
+        with self._lock:
+            self._stale[url] = text
+            self._stale.move_to_end(url)
+            while len(self._stale) > STALE_CACHE_SIZE:
+                self._stale.popitem(last=False)
+
+    def _fallback(self, url, error):
+        with self._lock:
+            text = self._stale.get(url)
+        if text is None:
+            raise error
+        FETCH_REQUESTS.inc(1, "stale")
+        return text
+
+    def get(self, url, headers=None):
+        """
+        Fetch `url` and return the response body as text. Falls back to the last
+        good copy of the page if the host is failing, otherwise raises FetchError
+        (CircuitOpenError, without any network access, while the circuit is open).
+        """
+        if self.mode == "replay":
+            try:
+                text = self._get_archive().get_text(url)
+            except FetchError:
+                FETCH_REQUESTS.inc(1, "error")
+                raise
+            except UnicodeDecodeError as e:
+                FETCH_REQUESTS.inc(1, "error")
+                raise FetchError(f"{url} is corrupt in the replay archive: {e}") from e
+            if text is None:
+                FETCH_REQUESTS.inc(1, "error")
+                raise FetchError(f"{url} is not in the replay archive")
+            FETCH_REQUESTS.inc(1, "replay")
+            return text
+
+        bucket, breaker = self._host_state(url)
+        if not breaker.allow():
+            FETCH_REQUESTS.inc(1, "circuit_open")
+            return self._fallback(url, CircuitOpenError(f"Circuit open for {urlsplit(url).netloc}"))
+
+        error = None
+        for attempt in range(self.max_retries + 1):
+            if not bucket.acquire():
+                breaker.cancel_trial()
+                FETCH_REQUESTS.inc(1, "throttled")
+                return self._fallback(url, FetchError(f"Rate limit for {urlsplit(url).netloc} exceeded"))
+
+            retry_after = None
+            try:
+                response = self.session.get(url, headers=headers or DEFAULT_HEADERS, timeout=self.timeout)
+            except (requests.Timeout, requests.ConnectionError) as e:
+                error = FetchError(f"Error fetching {url}: {e}")
+            except requests.RequestException as e:
+                # Invalid URL and the like: retrying won't help and the host isn't at fault
+                breaker.cancel_trial()
+                FETCH_REQUESTS.inc(1, "error")
+                raise FetchError(f"Error fetching {url}: {e}") from e
+            else:
+                if response.status_code == 200:
+                    breaker.record_success()
+                    FETCH_REQUESTS.inc(1, "ok")
+                    self._remember(url, response.text)
+                    return response.text
+                if response.status_code not in TRANSIENT_STATUS:
+                    # The host answered; a 404 or 403 for one page is not a host failure
+                    breaker.record_success()
+                    FETCH_REQUESTS.inc(1, "error")
+                    raise FetchError(f"Error fetching {url}: status code {response.status_code}")
+                error = FetchError(f"Error fetching {url}: status code {response.status_code}")
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None and retry_after > BACKOFF_MAX:
+                    # Longer than we'd wait in a retry: leave the host alone until then
+                    breaker.hold_off(retry_after)
+                    break
+
+            breaker.record_failure()
+            if attempt == self.max_retries or breaker.is_open:
+                break
+            FETCH_REQUESTS.inc(1, "retry")
+            backoff = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+            time.sleep(retry_after if retry_after is not None else backoff)
+
+        FETCH_REQUESTS.inc(1, "error")
+        return self._fallback(url, error)
+
+
+def _parse_retry_after(value):
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+# Shared fetcher used by the scrapers
+fetcher = Fetcher(mode=FETCH_MODE, archive=FETCH_ARCHIVE if FETCH_MODE != "live" else None)
+
+
+def fetch(url, headers=None):
+    """
+    Fetch a page through the shared fetcher. See Fetcher.get.
+    """
+    return fetcher.get(url, headers)
@@ -0,0 +1,86 @@
+import sys
+from dataclasses import dataclass
+from enum import Enum
+
+
+class Sentiment(str, Enum):
+    """
+    Sentiment label of an article. Members are str subclasses, so they compare
+    equal to "Positive"/"Negative"/"Neutral" and serialize as those strings.
+    """
+    Positive = "Positive"
+    Negative = "Negative"
+    Neutral = "Neutral"
+
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+def intern_topic(topic):
+    """
+    Intern a topic label so every article tagged with it shares one string.
+    """
+    return sys.intern(topic)
+
+
+@dataclass(slots=True)
+class Article:
+    """
+    A news article as it moves through the pipeline: fetched, then annotated
+    in place with sentiment and topics. Slotted to keep per-article memory low
+    for large batches.
+    """
+    title: str
+    content: str = ""
+    summary: str = ""
+    url: str = None
+    sentiment: Sentiment = None
+    topics: tuple = ()
+    # Set by sentence-level sentiment analysis only
+    sentiment_score: float = None
+    highlights: tuple = ()
+
+    def to_dict(self):
+        """
+        Return the article in the API response shape.
+        """
+        data = {
+            "Title": self.title,
+            "Summary": self.summary,
+            "Sentiment": self.sentiment,
+            "Topics": list(self.topics)
+        }
+        if self.url:
+            data["URL"] = self.url
+        if self.sentiment_score is not None:
+            data["Sentiment Score"] = self.sentiment_score
+        if self.highlights:
+            data["Highlights"] = list(self.highlights)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build an article from a dict using either the scraper keys
+        ("title", "content", ...) or the API keys ("Title", "Summary", ...).
+        """
+        def get(key):
+            value = data.get(key)
+            return value if value is not None else data.get(key.capitalize())
+
+        sentiment = get("sentiment")
+        return cls(
+            title=get("title") or "",
+            content=get("content") or "",
+            summary=get("summary") or "",
+            url=data.get("url") or data.get("URL"),
+            sentiment=Sentiment(sentiment) if sentiment else None,
+            topics=tuple(intern_topic(t) for t in get("topics") or ())
+        )
+
+    @classmethod
+    def coerce(cls, article):
+        """
+        Return `article` unchanged if it is already an Article, else convert it.
+        """
+        return article if isinstance(article, cls) else cls.from_dict(article)
@@ -0,0 +1,151 @@
+import mmap
+import os
+import struct
+import threading
+
+# Each record is: header, URL (utf-8), body (utf-8)
+MAGIC = b"NWS1"
+HEADER = struct.Struct("<4sIQ")  # magic, URL length, body length
+
+
+class ArchiveError(Exception):
+    """
+    The archive file is not a page archive.
+    """
+
+
+class PageArchive:
+    """
+    Append-only file of fetched pages, read back through a memory map.
+
+    Pages are appended as length-prefixed records, so recording never rewrites
+    existing data and a crash can at worst leave a torn final record, which is
+    ignored (and dropped when opened for writing). Damage anywhere else raises
+    ArchiveError rather than discarding the records after it. On open the record headers are scanned to build an in-memory
+    index of URL -> (offset, length); lookups then slice the memory map, so
+    replay needs no network access and no copying until the caller decodes.
+    If a URL was recorded more than once the latest copy wins.
+    """
+
+    def __init__(self, path, writable=False):
+        self.path = path
+        self.writable = writable
+        self._index = {}
+        self._lock = threading.Lock()
+        self._mmap = None
+        self._mapped_size = 0
+
+        if writable:
+            self._file = open(path, "a+b")
+        else:
+            self._file = open(path, "rb")
+        try:
+            self._end = self._scan()
+        except ArchiveError:
+            self.close()
+            raise
+        if writable and self._end != self._mapped_size:
+            # Drop a torn record left by an interrupted write (unmapping first,
+            # as some platforms refuse to truncate a mapped file)
+            print(f"Dropping {self._mapped_size - self._end} bytes of a torn final record from {self.path}")
+            self._mmap.close()
+            self._mmap = None
+            self._file.truncate(self._end)
+            self._remap()
+
+    def _remap(self):
+        # The previous map is not closed here: memoryviews handed out by get()
+        # may still reference it, and it is released once they are gone
+        size = os.fstat(self._file.fileno()).st_size
+        if size:
+            self._mmap = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+        self._mapped_size = size
+
+    def _scan(self):
+        # Returns the end of the last complete record. Only a torn final record
+        # (a partial header, or a record running past the end of the file) is
+        # tolerated; anything else unreadable is corruption and raises, so that
+        # opening for writing never truncates records that follow it.
+        self._remap()
+        offset = 0
+        while offset + HEADER.size <= self._mapped_size:
+            magic, url_length, body_length = HEADER.unpack_from(self._mmap, offset)
+            if magic != MAGIC:
+                if offset == 0:
+                    raise ArchiveError(f"{self.path} is not a page archive")
+                raise ArchiveError(f"{self.path} is corrupt at offset {offset}")
+            url_start = offset + HEADER.size
+            body_start = url_start + url_length
+            end = body_start + body_length
+            if end > self._mapped_size:
+                break
+            try:
+                url = str(self._mmap[url_start:body_start], "utf-8")
+            except UnicodeDecodeError as e:
+                raise ArchiveError(f"{self.path} is corrupt at offset {offset}: {e}") from e
+            self._index[url] = (body_start, body_length)
+            offset = end
+        return offset
+
+    def append(self, url, body):
+        """
+        Record a page. `body` may be str or bytes.
+        """
+        if not self.writable:
+            raise ArchiveError(f"{self.path} was opened read-only")
+        url_bytes = url.encode("utf-8")
+        body_bytes = body.encode("utf-8") if isinstance(body, str) else bytes(body)
+        with self._lock:
+            self._file.seek(self._end)
+            self._file.write(HEADER.pack(MAGIC, len(url_bytes), len(body_bytes)) + url_bytes + body_bytes)
+            self._file.flush()
+            body_start = self._end + HEADER.size + len(url_bytes)
+            self._index[url] = (body_start, len(body_bytes))
+            self._end = body_start + len(body_bytes)
+
+    def get(self, url):
+        """
+        Return the recorded body as a zero-copy memoryview, or None.
+        """
+        entry = self._index.get(url)
+        if entry is None:
+            return None
+        offset, length = entry
+        if offset + length > self._mapped_size:
+            # Recorded after the map was created
+            with self._lock:
+                if offset + length > self._mapped_size:
+                    self._remap()
+        return memoryview(self._mmap)[offset:offset + length]
+
+    def get_text(self, url):
+        """
+        Return the recorded body decoded as text, or None.
+        """
+        body = self.get(url)
+        return None if body is None else str(body, "utf-8")
+
+    def urls(self):
+        return list(self._index)
+
+    def __contains__(self, url):
+        return url in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def close(self):
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Callers still hold memoryviews; the map is released with them
+                pass
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,156 @@
+import hmac
+import os
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+
+# Profiling is opt-in per request and disabled unless configured. Both
+# starting a profile and reading profiles require the admin token, so
+# profiling stays off when no token is set.
+PROFILING_ENABLED = os.environ.get("PROFILING_ENABLED", "").lower() in ("1", "true", "yes")
+PROFILING_INTERVAL = float(os.environ.get("PROFILING_INTERVAL", "0.005"))
+PROFILING_MAX_PROFILES = int(os.environ.get("PROFILING_MAX_PROFILES", "50"))
+PROFILING_ADMIN_TOKEN = os.environ.get("PROFILING_ADMIN_TOKEN")
+
+if PROFILING_ENABLED and not PROFILING_ADMIN_TOKEN:
+    print("PROFILING_ENABLED is set but PROFILING_ADMIN_TOKEN is not; profiling stays disabled")
+    PROFILING_ENABLED = False
+
+# Header or query parameter a client sets to request a profile
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_PARAM = "profile"
+
+
+class SamplingProfiler:
+    """
+    Low-overhead wall-clock sampling profiler for a single thread.
+
+    A background thread periodically captures the target thread's stack via
+    sys._current_frames() and counts identical stacks. The target thread is
+    never interrupted, so the cost to the profiled code is only the GIL time
+    taken by each sample. Note that for async endpoints the target is the event
+    loop thread, so samples from other requests on the same loop can appear.
+    """
+
+    def __init__(self, request_id, interval=PROFILING_INTERVAL, thread_id=None):
+        self.request_id = request_id
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.stacks = Counter()
+        self.samples = 0
+        self.started_at = None
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name=f"profiler-{self.request_id}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self._start
+        store.add(self)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                break
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            # Collapsed stacks are ordered root first
+            self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed(self):
+        """
+        Return the profile in collapsed-stack format ("frame;frame;frame count"),
+        which flamegraph.pl, speedscope and inferno all accept.
+        """
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common()) + "\n"
+
+    def summary(self):
+        return {
+            "request_id": self.request_id,
+            "started_at": self.started_at,
+            "duration_seconds": round(self.duration, 4),
+            "samples": self.samples,
+            "interval_seconds": self.interval
+        }
+
+
+class ProfileStore:
+    """
+    Bounded in-memory store of recent profiles keyed by request ID.
+    Request IDs can be supplied by clients, so an ID that is already stored
+    gets a numeric suffix rather than replacing the earlier profile.
+    """
+
+    def __init__(self, max_profiles=PROFILING_MAX_PROFILES):
+        self.max_profiles = max_profiles
+        self._profiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, profiler):
+        with self._lock:
+            key = profiler.request_id
+            suffix = 1
+            while key in self._profiles:
+                suffix += 1
+                key = f"{profiler.request_id}-{suffix}"
+            profiler.request_id = key
+            self._profiles[key] = profiler
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+
+    def get(self, request_id):
+        with self._lock:
+            return self._profiles.get(request_id)
+
+    def list(self):
+        with self._lock:
+            profiles = list(self._profiles.values())
+        return [p.summary() for p in reversed(profiles)]
+
+
+store = ProfileStore()
+
+
+def profiling_requested(request):
+    """
+    Check whether the client asked for this request to be profiled.
+    """
+    flag = request.headers.get(PROFILE_HEADER) or request.query_params.get(PROFILE_QUERY_PARAM)
+    return flag is not None and flag.lower() in ("1", "true", "yes")
+
+
+def maybe_start(request, request_id):
+    """
+    Start a profiler for this request if profiling is enabled and requested
+    by an admin. Returns the running profiler, or None (at the cost of a
+    single flag check when profiling is disabled).
+    """
+    if not PROFILING_ENABLED or not profiling_requested(request) or not is_admin(request):
+        return None
+    return SamplingProfiler(request_id).start()
+
+
+def is_admin(request):
+    """
+    Check the request's X-Admin-Token header. Without a configured token
+    nobody is an admin.
+    """
+    if not PROFILING_ADMIN_TOKEN:
+        return False
+    token = request.headers.get("X-Admin-Token", "")
+    return hmac.compare_digest(token.encode("utf-8"), PROFILING_ADMIN_TOKEN.encode("utf-8"))
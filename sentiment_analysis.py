@@ -1,6 +1,7 @@
 from textblob import TextBlob
 import nltk
 from collections import Counter
+from models import Article, Sentiment
 
 # Download necessary components for TextBlob
 nltk.download('punkt')
@@ -8,24 +9,26 @@ nltk.download('punkt')
 def get_sentiment(text):
     """
     Determines the sentiment of a given text using TextBlob.
-    Returns 'Positive', 'Negative', or 'Neutral' based on polarity score.
+    Returns Sentiment.Positive, Sentiment.Negative, or Sentiment.Neutral based on polarity score.
     """
     blob = TextBlob(text)
     polarity = blob.sentiment.polarity  # Polarity ranges from -1 to 1
 
     if polarity > 0:
-        return "Positive"
+        return Sentiment.Positive
     elif polarity < 0:
-        return "Negative"
+        return Sentiment.Negative
     else:
-        return "Neutral"
+        return Sentiment.Neutral
 
 def comparative_sentiment_analysis(news_articles):
     """
     Performs comparative sentiment analysis on multiple news articles.
     Returns a sentiment distribution and highlights differences in coverage.
+    Accepts Article objects (or article dicts, which are converted).
     """
-    sentiments = [article["Sentiment"] for article in news_articles]
+    news_articles = [Article.coerce(article) for article in news_articles]
+    sentiments = [article.sentiment for article in news_articles]
     sentiment_counts = Counter(sentiments)
 
     analysis = {
@@ -41,9 +44,9 @@ def comparative_sentiment_analysis(news_articles):
     for i in range(len(news_articles) - 1):
         for j in range(i + 1, len(news_articles)):
             comparison = {
-                "Article 1": news_articles[i]["Title"],
-                "Article 2": news_articles[j]["Title"],
-                "Comparison": f"Article 1 has a {news_articles[i]['Sentiment']} tone, while Article 2 has a {news_articles[j]['Sentiment']} tone."
+                "Article 1": news_articles[i].title,
+                "Article 2": news_articles[j].title,
+                "Comparison": f"Article 1 has a {news_articles[i].sentiment} tone, while Article 2 has a {news_articles[j].sentiment} tone."
             }
             analysis["Coverage Differences"].append(comparison)
 
@@ -0,0 +1,100 @@
+import gzip
+import json
+
+from fastapi import Request
+from fastapi.responses import Response
+
+# orjson and brotli are optional: without them responses fall back to the
+# stdlib json encoder and gzip-only compression
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bodies smaller than this are sent uncompressed
+MIN_COMPRESS_SIZE = 1024
+# Moderate levels: most of the size win at a fraction of the CPU of the maximum
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+
+def dumps(content):
+    """
+    Serialize plain response data (dicts, lists, str, numbers, str enums,
+    dataclasses) to JSON bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def _default(value):
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def choose_encoding(accept_encoding):
+    """
+    Pick the best supported content coding from an Accept-Encoding header:
+    "br" when brotli is installed, then "gzip", else None for identity.
+    """
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0:
+            return encoding
+    return None
+
+
+def compress(body, encoding):
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+    return body
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response rendered with orjson when available.
+    """
+    media_type = "application/json"
+
+    def render(self, content):
+        return dumps(content)
+
+
+def json_response(request: Request, content, status_code=200):
+    """
+    Build a JSON response for already-plain data, compressed to match the
+    client's Accept-Encoding. Returning a Response directly from an endpoint
+    skips FastAPI's jsonable_encoder walk over the payload.
+    """
+    body = dumps(content)
+    headers = {"Vary": "Accept-Encoding"}
+    if len(body) >= MIN_COMPRESS_SIZE:
+        encoding = choose_encoding(request.headers.get("accept-encoding"))
+        if encoding:
+            body = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+    return Response(content=body, status_code=status_code, media_type=FastJSONResponse.media_type, headers=headers)
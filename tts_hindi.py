@@ -1,4 +1,5 @@
 from gtts import gTTS
+from io import BytesIO
 import os
 
 def text_to_speech(text, filename="output.mp3"):
@@ -9,6 +10,15 @@ def text_to_speech(text, filename="output.mp3"):
     tts.save(filename)  # Save as MP3 file
     return filename
 
+def text_to_speech_bytes(text):
+    """
+    Converts the given text into Hindi speech and returns the MP3 audio as bytes,
+    without writing a file that concurrent callers could overwrite.
+    """
+    buffer = BytesIO()
+    gTTS(text=text, lang="hi").write_to_fp(buffer)
+    return buffer.getvalue()
+
 # Example Usage:
 if __name__ == "__main__":
     summary_text = "टेस्ला की खबरें ज्यादातर सकारात्मक हैं। संभावित स्टॉक वृद्धि की उम्मीद है।"
@@ -1,4 +1,3 @@
-import requests
 from bs4 import BeautifulSoup
 import re
 import nltk
@@ -11,16 +10,187 @@ from sklearn.cluster import KMeans
 from transformers import pipeline
 import os
 import random
+import string
+from collections import Counter, deque
+from itertools import accumulate
+from io import BytesIO
 from gtts import gTTS
+from models import Article, Sentiment, intern_topic
+from http_fetch import fetch
 
 # Download necessary NLTK data
 nltk.download('vader_lexicon')
 nltk.download('punkt')
 nltk.download('stopwords')
 
-def extract_news_articles(company_name, num_articles=10):
+# Business topics recognised by get_article_topics, interned so that articles
+# tagged with the same topic share a single string
+BUSINESS_TOPICS = tuple(intern_topic(topic) for topic in [
+    "Stock Market", "Earnings", "Revenue", "Profit", "Loss",
+    "Investment", "Growth", "Decline", "Innovation", "Technology",
+    "Regulations", "Legal", "Lawsuit", "Competition", "Market Share",
+    "Expansion", "International", "Product Launch", "Research",
+    "Development", "Restructuring", "Layoffs", "Hiring", "Leadership",
+    "Sustainability", "Environment", "Social Responsibility"
+])
+
+# Localized summary templates per gTTS language code. Each summary is the
+# intro followed by the sentence for the overall outlook.
+SUMMARY_TEMPLATES = {
+    "en": {
+        "intro": "News analysis for {company}.",
+        "positive": "{company}'s latest news coverage is mostly positive. Potential stock growth expected.",
+        "negative": "{company}'s latest news coverage is mostly negative. Caution advised.",
+        "mixed": "{company}'s latest news coverage is mixed. Monitor developments closely."
+    },
+    "hi": {
+        "intro": "{company} के बारे में समाचार विश्लेषण।",
+        "positive": "{company} की हालिया खबरें ज्यादातर सकारात्मक हैं। शेयर में संभावित वृद्धि की उम्मीद है।",
+        "negative": "{company} की हालिया खबरें ज्यादातर नकारात्मक हैं। सावधानी बरतने की सलाह दी जाती है।",
+        "mixed": "{company} की हालिया खबरें मिली-जुली हैं। घटनाक्रम पर करीबी नज़र रखें।"
+    },
+    "bn": {
+        "intro": "{company} সম্পর্কে সংবাদ বিশ্লেষণ।",
+        "positive": "{company}-এর সাম্প্রতিক খবর বেশিরভাগই ইতিবাচক। শেয়ারের দাম বৃদ্ধির সম্ভাবনা রয়েছে।",
+        "negative": "{company}-এর সাম্প্রতিক খবর বেশিরভাগই নেতিবাচক। সতর্ক থাকার পরামর্শ দেওয়া হচ্ছে।",
+        "mixed": "{company}-এর সাম্প্রতিক খবর মিশ্র। পরিস্থিতির দিকে নজর রাখুন।"
+    },
+    "mr": {
+        "intro": "{company} बद्दल बातम्यांचे विश्लेषण.",
+        "positive": "{company} च्या ताज्या बातम्या बहुतांश सकारात्मक आहेत. शेअरमध्ये वाढ अपेक्षित आहे.",
+        "negative": "{company} च्या ताज्या बातम्या बहुतांश नकारात्मक आहेत. सावधगिरी बाळगण्याचा सल्ला दिला जातो.",
+        "mixed": "{company} च्या ताज्या बातम्या संमिश्र आहेत. घडामोडींवर बारकाईने लक्ष ठेवा."
+    },
+    "gu": {
+        "intro": "{company} વિશે સમાચાર વિશ્લેષણ.",
+        "positive": "{company} ના તાજેતરના સમાચાર મોટે ભાગે સકારાત્મક છે. શેરમાં વૃદ્ધિની સંભાવના છે.",
+        "negative": "{company} ના તાજેતરના સમાચાર મોટે ભાગે નકારાત્મક છે. સાવચેત રહેવાની સલાહ છે.",
+        "mixed": "{company} ના તાજેતરના સમાચાર મિશ્ર છે. ઘટનાક્રમ પર નજર રાખો."
+    },
+    "ta": {
+        "intro": "{company} பற்றிய செய்தி பகுப்பாய்வு.",
+        "positive": "{company} பற்றிய சமீபத்திய செய்திகள் பெரும்பாலும் நேர்மறையானவை. பங்கு விலை உயர வாய்ப்புள்ளது.",
+        "negative": "{company} பற்றிய சமீபத்திய செய்திகள் பெரும்பாலும் எதிர்மறையானவை. எச்சரிக்கை தேவை.",
+        "mixed": "{company} பற்றிய சமீபத்திய செய்திகள் கலவையானவை. நிலைமையை கவனமாக கண்காணிக்கவும்."
+    },
+    "te": {
+        "intro": "{company} గురించి వార్తా విశ్లేషణ.",
+        "positive": "{company} గురించిన తాజా వార్తలు ఎక్కువగా సానుకూలంగా ఉన్నాయి. షేర్ ధర పెరిగే అవకాశం ఉంది.",
+        "negative": "{company} గురించిన తాజా వార్తలు ఎక్కువగా ప్రతికూలంగా ఉన్నాయి. జాగ్రత్తగా ఉండాలని సూచన.",
+        "mixed": "{company} గురించిన తాజా వార్తలు మిశ్రమంగా ఉన్నాయి. పరిణామాలను జాగ్రత్తగా గమనించండి."
+    }
+}
+
+SUPPORTED_LANGUAGES = tuple(SUMMARY_TEMPLATES)
+
+# Sentence pools for generate_news_articles, by the sentiment they convey
+MOCK_SENTENCES = {
+    "Positive": [
+        "{company} reported strong results in {topic}, beating analyst expectations.",
+        "Investors welcomed the progress {company} has made on {topic}.",
+        "Analysts upgraded {company}, praising its success in {topic}.",
+        "{company} shares rallied after an impressive update on {topic}.",
+        "The company's growth in {topic} was described as excellent by industry experts.",
+        "{company} celebrated a record quarter, with {topic} leading the gains."
+    ],
+    "Negative": [
+        "{company} warned of weak demand and mounting losses in {topic}.",
+        "Investors worried about the problems {company} faces in {topic}.",
+        "Analysts downgraded {company}, criticizing its failures in {topic}.",
+        "{company} shares fell sharply after a disappointing update on {topic}.",
+        "Regulators raised serious concerns about {company}'s handling of {topic}.",
+        "{company} cut jobs as the crisis in {topic} deepened."
+    ],
+    "Neutral": [
+        "{company} published its quarterly report covering {topic}.",
+        "The board of {company} met on Tuesday to review {topic}.",
+        "{company} outlined its plans for {topic} at an industry conference.",
+        "A spokesperson for {company} said an update on {topic} will follow next month.",
+        "{company} operates in several markets, including {topic}."
+    ]
+}
+
+MOCK_HEADLINES = {
+    "Positive": ["{company} Soars on {topic} Success", "{company} Beats Expectations in {topic}", "Analysts Upgrade {company} After {topic} Gains"],
+    "Negative": ["{company} Slumps on {topic} Concerns", "{company} Misses Targets in {topic}", "Investors Wary as {company} Struggles with {topic}"],
+    "Neutral": ["{company} Reviews {topic} Strategy", "{company} Outlines {topic} Plans", "{company} Publishes {topic} Update"]
+}
+
+# Default share of each sentiment among generated articles
+DEFAULT_SENTIMENT_MIX = {"Positive": 0.4, "Negative": 0.35, "Neutral": 0.25}
+
+def generate_news_articles(company_name, num_articles=10, seed=None, sentences=4, sentiment_mix=None,
+                           topic_mix=None, duplicate_rate=0.0):
+    """
+    Lazily generate mock news articles for load testing.
+    The same seed always yields the same articles, and articles are produced
+    one at a time so arbitrarily long runs use constant memory.
+    Pass num_articles=None for an endless stream.
+    
+    sentences: number of sentences per article (article length)
+    sentiment_mix: relative weights for "Positive", "Negative" and "Neutral" articles
+    topic_mix: relative weights per topic (defaults to all BUSINESS_TOPICS equally)
+    duplicate_rate: probability that an article repeats one of the recent articles
+    
+    Each article's `sentiment` is the label it was written to convey, as
+    ground truth for the sentiment stages. Raises ValueError for an unknown
+    sentiment label or invalid weights.
+    """
+    sentiment_mix = sentiment_mix or DEFAULT_SENTIMENT_MIX
+    unknown = [label for label in sentiment_mix if label not in MOCK_SENTENCES]
+    if unknown:
+        raise ValueError(f"Unknown sentiment labels {unknown}; expected some of {list(MOCK_SENTENCES)}")
+    _check_weights("sentiment_mix", sentiment_mix)
+    topic_mix = topic_mix or {topic: 1 for topic in BUSINESS_TOPICS}
+    _check_weights("topic_mix", topic_mix)
+    # Validated here rather than in the generator, which would only raise on the first next()
+    return _generate_news_articles(company_name, num_articles, seed, sentences, sentiment_mix, topic_mix,
+                                   duplicate_rate)
+
+def _check_weights(name, mix):
+    if any(weight < 0 for weight in mix.values()) or sum(mix.values()) <= 0:
+        raise ValueError(f"{name} weights must be non-negative with a positive total, got {mix}")
+
+def _generate_news_articles(company_name, num_articles, seed, sentences, sentiment_mix, topic_mix, duplicate_rate):
+    rng = random.Random(seed)
+    
+    labels = list(sentiment_mix)
+    label_weights = list(accumulate(sentiment_mix[label] for label in labels))
+    topics = [intern_topic(topic) for topic in topic_mix]
+    topic_weights = list(accumulate(topic_mix.values()))
+    
+    # Only a bounded window of recent articles is kept for duplicates
+    recent = deque(maxlen=100)
+    generated = 0
+    while num_articles is None or generated < num_articles:
+        generated += 1
+        if recent and rng.random() < duplicate_rate:
+            original = rng.choice(recent)
+            yield Article(title=original.title, content=original.content, summary=original.summary,
+                          sentiment=original.sentiment)
+            continue
+        
+        label = rng.choices(labels, cum_weights=label_weights)[0]
+        topic = rng.choices(topics, cum_weights=topic_weights)[0]
+        # Mostly sentences of the article's own sentiment, with some neutral filler
+        parts = []
+        for _ in range(sentences):
+            pool = MOCK_SENTENCES[label] if rng.random() < 0.75 else MOCK_SENTENCES["Neutral"]
+            sentence_topic = topic if rng.random() < 0.6 else rng.choices(topics, cum_weights=topic_weights)[0]
+            parts.append(rng.choice(pool).format(company=company_name, topic=sentence_topic.lower()))
+        
+        title = rng.choice(MOCK_HEADLINES[label]).format(company=company_name, topic=topic)
+        content = " ".join(parts)
+        summary = content[:150] + "..." if len(content) > 150 else content
+        article = Article(title=title, content=content, summary=summary, sentiment=Sentiment(label))
+        recent.append(article)
+        yield article
+
+def extract_news_articles(company_name, num_articles=10, seed=None):
     """
     Extract news articles related to a given company.
+    Pass a seed to get the same articles on every call. Requests for more
+    articles than there are templates are served by generate_news_articles.
     """
     # In a real implementation, you would use a news API or web scraping.
     # For this assignment, we'll create mock news articles
@@ -62,36 +232,140 @@ def extract_news_articles(company_name, num_articles=10):
         "{company}'s quarterly results fell short of analyst expectations, causing a dip in stock price. The company attributes the underperformance to supply chain challenges and increasing competition."
     ]
     
+    # The templates run out, so larger requests come from the generator
+    if num_articles > len(potential_titles):
+        return list(generate_news_articles(company_name, num_articles, seed=seed))
+    
     # Randomly select articles to create a diverse set
-    selected_indices = random.sample(range(len(potential_titles)), min(num_articles, len(potential_titles)))
+    rng = random.Random(seed)
+    selected_indices = rng.sample(range(len(potential_titles)), min(num_articles, len(potential_titles)))
     
     for i in selected_indices:
         title = potential_titles[i]
         content = content_templates[i].format(company=company_name)
         summary = content[:150] + "..." if len(content) > 150 else content
         
-        articles.append({
-            "title": title,
-            "content": content,
-            "summary": summary
-        })
+        articles.append(Article(title=title, content=content, summary=summary))
     
     return articles
 
-def perform_sentiment_analysis(text):
+# Compound scores within this band of zero count as Neutral
+NEUTRAL_BAND = 0.05
+
+# Sentence-level sentiment: sentences are scored a batch at a time, and scoring
+# stops once enough opinionated sentences were seen and the mean opinion score
+# clears the Neutral band with 90% one-sided confidence (z = 1.28)
+SENTENCE_BATCH_SIZE = 16
+SENTENCE_MIN_OPINIONS = 8
+SENTENCE_CONFIDENCE_Z = 1.28
+MAX_HIGHLIGHTS = 3
+
+# Split after ., ! or ? followed by whitespace and the start of a new sentence
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[\"'(\[]?[A-Z0-9])")
+PUNCTUATION = string.punctuation
+
+_sentiment_analyzer = None
+
+def get_sentiment_analyzer():
     """
-    Perform sentiment analysis on the given text.
-    Returns: "Positive", "Negative", or "Neutral"
+    Return the shared VADER analyzer. Building one loads the whole lexicon,
+    which costs far more than scoring a typical article.
     """
-    sia = SentimentIntensityAnalyzer()
-    sentiment_score = sia.polarity_scores(text)
-    
-    if sentiment_score['compound'] >= 0.05:
-        return "Positive"
-    elif sentiment_score['compound'] <= -0.05:
-        return "Negative"
+    global _sentiment_analyzer
+    if _sentiment_analyzer is None:
+        _sentiment_analyzer = SentimentIntensityAnalyzer()
+    return _sentiment_analyzer
+
+def _label(score):
+    if score >= NEUTRAL_BAND:
+        return Sentiment.Positive
+    elif score <= -NEUTRAL_BAND:
+        return Sentiment.Negative
     else:
-        return "Neutral"
+        return Sentiment.Neutral
+
+def split_sentences(text):
+    """
+    Split text into sentences on terminal punctuation.
+    """
+    return [sentence for sentence in (part.strip() for part in SENTENCE_BOUNDARY.split(text)) if sentence]
+
+def analyze_sentence_sentiment(text, batch_size=SENTENCE_BATCH_SIZE, min_opinions=SENTENCE_MIN_OPINIONS,
+                               z=SENTENCE_CONFIDENCE_Z, max_highlights=MAX_HIGHLIGHTS):
+    """
+    Sentence-level sentiment for long articles.
+
+    Each sentence is scored with VADER, and the article score is the mean
+    compound score of its opinionated sentences (those outside the Neutral
+    band), so boilerplate and factual sentences don't dilute the signal. The
+    label comes from the end of the score's confidence interval nearest zero,
+    so an article with only scattered or mixed opinions stays Neutral.
+    Scoring stops early once at least `min_opinions` opinionated sentences
+    have been seen and the interval lies wholly outside the Neutral band.
+
+    Returns a dict with the sentiment label, the article score, the number of
+    sentences and how many were scored, and up to `max_highlights` of the
+    strongest scored sentences as {"Sentence", "Score"} dicts.
+    """
+    sia = get_sentiment_analyzer()
+    lexicon = sia.lexicon.keys()
+    sentences = split_sentences(text)
+    scores = np.zeros(len(sentences))
+    scored = 0
+    opinions = scores[:0]
+    for start in range(0, len(sentences), batch_size):
+        batch = sentences[start:start + batch_size]
+        # VADER only gives valence to lexicon words, so a sentence without any
+        # scores exactly 0 and is skipped; in news copy that is most of them
+        for i, sentence in enumerate(batch, start):
+            tokens = sentence.lower().split()
+            if not (lexicon.isdisjoint(tokens) and lexicon.isdisjoint(token.strip(PUNCTUATION) for token in tokens)):
+                scores[i] = sia.polarity_scores(sentence)["compound"]
+        scored = start + len(batch)
+
+        opinions = scores[:scored][np.abs(scores[:scored]) >= NEUTRAL_BAND]
+        if len(opinions) >= min_opinions and abs(_lower_bound(opinions, z)) >= NEUTRAL_BAND:
+            break
+
+    score = float(opinions.mean()) if len(opinions) else 0.0
+    strongest = np.argsort(-np.abs(scores[:scored]), kind="stable")[:max_highlights]
+    highlights = tuple(
+        {"Sentence": sentences[i], "Score": round(float(scores[i]), 3)}
+        for i in strongest if abs(scores[i]) >= NEUTRAL_BAND
+    )
+    return {
+        "sentiment": _label(_lower_bound(opinions, z)),
+        "score": round(score, 3),
+        "sentences": len(sentences),
+        "scored": scored,
+        "highlights": highlights
+    }
+
+def _lower_bound(opinions, z):
+    # The end of the mean's confidence interval nearest zero (0 if it spans zero)
+    if len(opinions) == 0:
+        return 0.0
+    mean = opinions.mean()
+    if len(opinions) == 1:
+        return float(mean)
+    margin = z * opinions.std(ddof=1) / np.sqrt(len(opinions))
+    return float(np.sign(mean) * max(0.0, abs(mean) - margin))
+
+def perform_sentiment_analysis(text, mode="document"):
+    """
+    Perform sentiment analysis on the given text.
+    mode="document" scores the whole text in one call; mode="sentence" scores
+    it sentence by sentence (see analyze_sentence_sentiment), which is faster
+    and less diluted on long scraped articles.
+    Returns: Sentiment.Positive, Sentiment.Negative, or Sentiment.Neutral
+    """
+    if mode == "sentence":
+        return analyze_sentence_sentiment(text)["sentiment"]
+    if mode != "document":
+        raise ValueError(f"Unknown sentiment mode {mode!r}; expected 'document' or 'sentence'")
+
+    sentiment_score = get_sentiment_analyzer().polarity_scores(text)
+    return _label(sentiment_score['compound'])
 
 def get_article_topics(text, num_topics=3):
     """
@@ -99,14 +373,7 @@ def get_article_topics(text, num_topics=3):
     """
     # In a real implementation, you might use topic modeling like LDA
     # For simplicity, we'll use a predefined list of business topics
-    business_topics = [
-        "Stock Market", "Earnings", "Revenue", "Profit", "Loss",
-        "Investment", "Growth", "Decline", "Innovation", "Technology",
-        "Regulations", "Legal", "Lawsuit", "Competition", "Market Share",
-        "Expansion", "International", "Product Launch", "Research",
-        "Development", "Restructuring", "Layoffs", "Hiring", "Leadership",
-        "Sustainability", "Environment", "Social Responsibility"
-    ]
+    business_topics = BUSINESS_TOPICS
     
     # Extract potential topics based on word frequency
     tokens = word_tokenize(text.lower())
@@ -129,18 +396,14 @@ def get_article_topics(text, num_topics=3):
 def generate_comparative_analysis(articles):
     """
     Generate comparative analysis across multiple articles.
+    Accepts Article objects (or article dicts, which are converted).
     """
-    # Extract all unique topics
-    all_topics = []
-    for article in articles:
-        all_topics.extend(article["Topics"])
-    unique_topics = list(set(all_topics))
+    articles = [Article.coerce(article) for article in articles]
     
-    # Find common topics
-    topic_counts = {topic: 0 for topic in unique_topics}
+    # Count how many articles mention each topic (an article lists a topic at most once)
+    topic_counts = Counter()
     for article in articles:
-        for topic in article["Topics"]:
-            topic_counts[topic] += 1
+        topic_counts.update(article.topics)
     
     common_topics = [topic for topic, count in topic_counts.items() if count > 1]
     
@@ -151,8 +414,8 @@ def generate_comparative_analysis(articles):
             article1 = articles[i]
             article2 = articles[j]
             
-            if article1["Sentiment"] != article2["Sentiment"]:
-                comparison = f"Article {i+1} ({article1['Title']}) has a {article1['Sentiment']} sentiment, while Article {j+1} ({article2['Title']}) has a {article2['Sentiment']} sentiment."
+            if article1.sentiment != article2.sentiment:
+                comparison = f"Article {i+1} ({article1.title}) has a {article1.sentiment} sentiment, while Article {j+1} ({article2.title}) has a {article2.sentiment} sentiment."
                 impact = f"This contrast shows different perspectives on the company, potentially affecting investor perception."
                 coverage_differences.append({
                     "Comparison": comparison,
@@ -160,8 +423,8 @@ def generate_comparative_analysis(articles):
                 })
             
             # Compare topics
-            unique_topics_1 = [t for t in article1["Topics"] if t not in article2["Topics"]]
-            unique_topics_2 = [t for t in article2["Topics"] if t not in article1["Topics"]]
+            unique_topics_1 = [t for t in article1.topics if t not in article2.topics]
+            unique_topics_2 = [t for t in article2.topics if t not in article1.topics]
             
             if unique_topics_1 and unique_topics_2:
                 comparison = f"Article {i+1} focuses on {', '.join(unique_topics_1)}, whereas Article {j+1} covers {', '.join(unique_topics_2)}."
@@ -170,6 +433,12 @@ def generate_comparative_analysis(articles):
                     "Comparison": comparison,
                     "Impact": impact
                 })
+            
+            # Only the first few comparisons are reported
+            if len(coverage_differences) >= 5:
+                break
+        if len(coverage_differences) >= 5:
+            break
     
     # If no meaningful comparisons found, add a generic one
     if not coverage_differences:
@@ -183,14 +452,9 @@ def generate_comparative_analysis(articles):
         "Common Topics": common_topics if common_topics else ["No common topics found"]
     }
     
-    # Add unique topics for each article
+    # Add unique topics for each article (topics no other article mentions)
     for i, article in enumerate(articles):
-        other_articles_topics = []
-        for j, other_article in enumerate(articles):
-            if i != j:
-                other_articles_topics.extend(other_article["Topics"])
-        
-        unique_topics = [topic for topic in article["Topics"] if topic not in other_articles_topics]
+        unique_topics = [topic for topic in article.topics if topic_counts[topic] == 1]
         if unique_topics:
             topic_overlap[f"Unique Topics in Article {i+1}"] = unique_topics
     
@@ -199,6 +463,34 @@ def generate_comparative_analysis(articles):
         "Topic Overlap": topic_overlap
     }
 
+def get_overall_outlook(sentiments):
+    """
+    Summarize a sentiment distribution as "positive", "negative" or "mixed".
+    """
+    if sentiments["Positive"] > sentiments["Negative"]:
+        return "positive"
+    elif sentiments["Positive"] < sentiments["Negative"]:
+        return "negative"
+    else:
+        return "mixed"
+
+def generate_summary(company_name, outlook, lang="hi"):
+    """
+    Build the localized news summary for a company from the language's templates.
+    """
+    templates = SUMMARY_TEMPLATES[lang]
+    return f"{templates['intro']} {templates[outlook]}".format(company=company_name)
+
+def generate_tts(text, lang="hi"):
+    """
+    Convert text to speech in the given language using gTTS.
+    Returns the MP3 audio as bytes.
+    """
+    buffer = BytesIO()
+    tts = gTTS(text=text, lang=lang, slow=False)
+    tts.write_to_fp(buffer)
+    return buffer.getvalue()
+
 def generate_hindi_tts(text):
     """
     Convert text to Hindi speech using gTTS.
@@ -206,27 +498,28 @@ def generate_hindi_tts(text):
     """
     output_file = "hindi_summary.mp3"
     
-    # Convert English text to Hindi for demonstration
-    # In a real implementation, use a translation API or model
-    hindi_text = text  # Assuming text is already in Hindi for this demo
-    
     # Generate the speech
-    tts = gTTS(text=hindi_text, lang='hi', slow=False)
-    tts.save(output_file)
+    with open(output_file, "wb") as f:
+        f.write(generate_tts(text, lang="hi"))
     
     return output_file
 
+# News sources tried by scrape_news_articles, formatted with the company name
+# (these are examples, would need to be verified for scraping feasibility)
+NEWS_SOURCES = [
+    "https://www.reuters.com/search/news?blob={company}",
+    "https://news.google.com/search?q={company}&hl=en-US&gl=US&ceid=US:en"
+]
+
 # Implement a real news scraping function (commented out as alternative to mock data)
 def scrape_news_articles(company_name, num_articles=10):
     """
     Scrape news articles about a company from non-JS websites using BeautifulSoup.
     This is an alternative to the mock data function and would be used in a real deployment.
+    Pages are fetched through http_fetch, so failing hosts are skipped quickly and
+    the shortfall is made up with mock articles.
     """
-    # List of potential news sources (these are examples, would need to be verified for scraping feasibility)
-    news_sources = [
-        f"https://www.reuters.com/search/news?blob={company_name}",
-        f"https://news.google.com/search?q={company_name}&hl=en-US&gl=US&ceid=US:en"
-    ]
+    news_sources = [source.format(company=company_name) for source in NEWS_SOURCES]
     
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
@@ -240,65 +533,58 @@ def scrape_news_articles(company_name, num_articles=10):
             break
             
         try:
-            response = requests.get(source, headers=headers, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+            page = fetch(source, headers)
+            soup = BeautifulSoup(page, 'html.parser')
+            
+            # The selectors would need to be adjusted based on the specific website structure
+            article_elements = soup.select("article") or soup.select(".article") or soup.select(".story")
+            
+            for article_elem in article_elements[:num_articles - len(articles)]:
+                # Extract title - adjust selectors based on site structure
+                title_elem = article_elem.select_one("h1") or article_elem.select_one("h2") or article_elem.select_one(".title")
+                if not title_elem:
+                    continue
+                title = title_elem.get_text().strip()
                 
-                # The selectors would need to be adjusted based on the specific website structure
-                article_elements = soup.select("article") or soup.select(".article") or soup.select(".story")
+                # Extract URL to fetch full content
+                link_elem = article_elem.select_one("a")
+                if not link_elem:
+                    continue
                 
-                for article_elem in article_elements[:num_articles - len(articles)]:
-                    # Extract title - adjust selectors based on site structure
-                    title_elem = article_elem.select_one("h1") or article_elem.select_one("h2") or article_elem.select_one(".title")
-                    if not title_elem:
+                article_url = link_elem.get("href")
+                if not article_url.startswith("http"):
+                    # Handle relative URLs
+                    if article_url.startswith("/"):
+                        base_url = "/".join(source.split("/")[:3])
+                        article_url = base_url + article_url
+                    else:
                         continue
-                    title = title_elem.get_text().strip()
+                
+                # Fetch full article content
+                try:
+                    article_page = fetch(article_url, headers)
+                    article_soup = BeautifulSoup(article_page, 'html.parser')
                     
-                    # Extract URL to fetch full content
-                    link_elem = article_elem.select_one("a")
-                    if not link_elem:
+                    # Extract content - adjust selectors based on site structure
+                    content_elem = article_soup.select_one(".article-body") or article_soup.select_one(".content") or article_soup.select_one("article")
+                    if not content_elem:
                         continue
+                        
+                    content = content_elem.get_text().strip()
                     
-                    article_url = link_elem.get("href")
-                    if not article_url.startswith("http"):
-                        # Handle relative URLs
-                        if article_url.startswith("/"):
-                            base_url = "/".join(source.split("/")[:3])
-                            article_url = base_url + article_url
-                        else:
-                            continue
+                    # Create summary (first paragraph or first 150 chars)
+                    summary_elem = content_elem.select_one("p")
+                    summary = summary_elem.get_text().strip() if summary_elem else content[:150] + "..."
                     
-                    # Fetch full article content
-                    try:
-                        article_response = requests.get(article_url, headers=headers, timeout=10)
-                        if article_response.status_code == 200:
-                            article_soup = BeautifulSoup(article_response.text, 'html.parser')
-                            
-                            # Extract content - adjust selectors based on site structure
-                            content_elem = article_soup.select_one(".article-body") or article_soup.select_one(".content") or article_soup.select_one("article")
-                            if not content_elem:
-                                continue
-                                
-                            content = content_elem.get_text().strip()
-                            
-                            # Create summary (first paragraph or first 150 chars)
-                            summary_elem = content_elem.select_one("p")
-                            summary = summary_elem.get_text().strip() if summary_elem else content[:150] + "..."
-                            
-                            articles.append({
-                                "title": title,
-                                "content": content,
-                                "summary": summary,
-                                "url": article_url
-                            })
-                            
-                            if len(articles) >= num_articles:
-                                break
-                                
-                    except Exception as e:
-                        print(f"Error fetching article content: {str(e)}")
-                        continue
+                    articles.append(Article(title=title, content=content, summary=summary, url=article_url))
+                    
+                    if len(articles) >= num_articles:
+                        break
                         
+                except Exception as e:
+                    print(f"Error fetching article content: {str(e)}")
+                    continue
+                    
         except Exception as e:
             print(f"Error scraping news source {source}: {str(e)}")
             continue